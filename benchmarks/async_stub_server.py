@@ -0,0 +1,79 @@
+"""Fetches public company pages concurrently through the asyncio facade,
+against a local stub server instead of LinkedIn.
+
+    python benchmarks/async_stub_server.py [companies] [server delay in ms]
+"""
+import asyncio
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from linkedin_scraper import Company, backends
+from linkedin_scraper.aio import AsyncSession
+
+
+def public_page(slug):
+    return (
+        '<html><body><h1 class="name">{0}</h1>'
+        '<p class="basic-info-description">About {0}</p>'
+        '<div class="website"><h3>Website</h3><a>https://{0}.example</a></div>'
+        '<span class="industry">Software</span><span class="company-size">11-50</span>'
+        '<div class="affiliated-companies"><div class="affiliated-company-name">'
+        '<a href="https://www.linkedin.com/company/{0}-labs">{0} Labs</a></div></div>'
+        "</body></html>".format(slug)
+    ).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        body = public_page(self.path.strip("/").split("/")[-1])
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+async def fetch_all(base_url, count):
+    async with AsyncSession(http=backends.HttpBackend(pool_size=32)) as session:
+        return await asyncio.gather(
+            *(
+                Company.fetch("{}/company/company-{}".format(base_url, i), session)
+                for i in range(count)
+            )
+        )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    StubHandler.delay = (int(sys.argv[2]) if len(sys.argv) > 2 else 50) / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = "http://127.0.0.1:{}".format(server.server_address[1])
+    try:
+        started = time.perf_counter()
+        companies = asyncio.run(fetch_all(base_url, count))
+        elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+
+    assert [company.name for company in companies] == [
+        "company-{}".format(i) for i in range(count)
+    ]
+    assert all(len(company.affiliated_companies) == 1 for company in companies)
+    print(
+        "{} companies in {:.2f}s ({:.0f}/s, {:.0f}ms serial)".format(
+            count, elapsed, count / elapsed, count * StubHandler.delay * 1000
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Memory regression check for batch company scraping.
+
+Runs N fixture companies (parsed from synthetic saved pages) through
+`Company.batch` with a JSON sink and `drop_heavy=True`, and asserts that the
+memory in use stays flat while the batch runs.
+
+    python benchmarks/company_memory.py [companies] [employees]
+"""
+import os
+import sys
+import tracemalloc
+
+from linkedin_scraper import Company, serializers
+
+TOLERANCE = 256 * 1024
+
+
+def about_page(i):
+    cards = "".join(
+        '<div class="org-company-card"><a class="company-name-link" href="https://www.linkedin.com/company/{0}-{1}">'
+        'Company {0}-{1}</a><span class="company-followers-count">{1} followers</span></div>'.format(i, j)
+        for j in range(20)
+    )
+    return (
+        '<html><body><h1 class="org-top-card-summary__title">Company {0}</h1>'
+        '<section class="artdeco-card org-page-details-module__card-spacing org-about-module__margin-bottom">'
+        "<p>About company {0}</p><dl><dt>Website</dt><dd>https://company{0}.example</dd>"
+        "<dt>Industry</dt><dd>Software</dd><dt>Founded</dt><dd>2001</dd></dl></section>"
+        '<div class="company-list">{1}</div><div class="company-list">{1}</div>'
+        "</body></html>".format(i, cards)
+    )
+
+
+def people_page(i, employees):
+    return (
+        '<html><body><ul class="list-style-none">'
+        + "".join(
+            '<li><a href="https://www.linkedin.com/in/{0}-{1}">Person {1}</a>'
+            "<div>x</div><div>y</div><div>Engineer at Company {0}</div></li>".format(i, j)
+            for j in range(employees)
+        )
+        + "</ul></body></html>"
+    )
+
+
+def fixture_companies(count, employees):
+    for i in range(count):
+        yield Company.from_html(
+            {"about": about_page(i), "people": people_page(i, employees)},
+            linkedin_url="https://www.linkedin.com/company/{}".format(i),
+        )
+
+
+def resident_memory():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def main(count, employees):
+    with open(os.devnull, "w") as sink_file:
+
+        def sink(company):
+            serializers.dump(company, sink_file)
+            sink_file.write("\n")
+
+        tracemalloc.start()
+        warmup = max(count // 10, 1)
+        baseline = None
+        for n, company in enumerate(
+            Company.batch(fixture_companies(count, employees), sink=sink, drop_heavy=True),
+            start=1,
+        ):
+            if n == warmup:
+                baseline, _ = tracemalloc.get_traced_memory()
+                baseline_rss = resident_memory()
+        final, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print("{} companies x {} employees".format(count, employees))
+    print("traced after warmup : {:.1f}KB".format(baseline / 1024))
+    print("traced at the end   : {:.1f}KB".format(final / 1024))
+    print("traced peak         : {:.1f}KB".format(peak / 1024))
+    if baseline_rss is not None:
+        print("rss growth          : {:.1f}KB".format((resident_memory() - baseline_rss) / 1024))
+    assert final - baseline < TOLERANCE, "memory grew by {} bytes".format(final - baseline)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,59 @@
+"""Compares the bytes transferred per page by a plain headless Chrome and by
+`browser.lean_chrome`, on the same pages with the same saved session.
+
+    python benchmarks/driver_bytes.py <session.json> <url> [url ...]
+
+The session file is written by `actions.SessionStore` after a login.
+"""
+import sys
+import time
+
+from selenium import webdriver
+
+from linkedin_scraper import actions, browser
+
+
+def plain_chrome():
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(options=options)
+
+
+def measure(driver, session, urls):
+    if not session.restore(driver):
+        raise SystemExit("the saved session has expired, log in again")
+    transferred = []
+    started = time.perf_counter()
+    for url in urls:
+        driver.get(url)
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(2)
+        transferred.append(browser.transferred_bytes(driver))
+    return transferred, time.perf_counter() - started
+
+
+def main():
+    if len(sys.argv) < 3:
+        raise SystemExit(__doc__)
+    session = actions.SessionStore(sys.argv[1])
+    urls = sys.argv[2:]
+    results = {}
+    for name, factory in (("plain", plain_chrome), ("lean", browser.lean_chrome)):
+        driver = factory()
+        try:
+            results[name] = measure(driver, session, urls)
+        finally:
+            driver.quit()
+
+    for name, (transferred, seconds) in results.items():
+        print(
+            "{:>6}: {:>10,.0f} bytes/page  {:.2f}s/page".format(
+                name, sum(transferred) / len(transferred), seconds / len(urls)
+            )
+        )
+    plain, lean = (sum(results[name][0]) for name in ("plain", "lean"))
+    print("lean transfers {:.0%} less".format(1 - lean / plain if plain else 0))
+
+
+if __name__ == "__main__":
+    main()
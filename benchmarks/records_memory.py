@@ -0,0 +1,47 @@
+"""Compares the memory used by the record dataclasses and their slotted
+counterparts from `compact_record_type`.
+
+    python benchmarks/records_memory.py [count]
+"""
+import sys
+import tracemalloc
+
+from linkedin_scraper.objects import (
+    Certification,
+    Contact,
+    Education,
+    Experience,
+    Language,
+    Skill,
+    compact_record_type,
+)
+
+
+def measure(record_type, values):
+    tracemalloc.start()
+    records = [record_type(**value) for value in values]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def main(count):
+    print("{:<15} {:>12} {:>12} {:>7}".format("record", "dataclass", "slotted", "saved"))
+    for record_type in (Experience, Education, Certification, Contact, Skill, Language):
+        # field values are shared between both runs so only the records count
+        values = [
+            {name: "{}-{}".format(name, i % 100) for name in record_type.__dataclass_fields__}
+            for i in range(count)
+        ]
+        plain = measure(record_type, values)
+        slotted = measure(compact_record_type(record_type), values)
+        print(
+            "{:<15} {:>10.1f}MB {:>10.1f}MB {:>7.0%}".format(
+                record_type.__name__, plain / 2**20, slotted / 2**20, 1 - slotted / plain
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,79 @@
+"""Compares `dataclasses.asdict` + `json.dumps` with the `serializers` module
+on large synthetic profiles.
+
+    python benchmarks/serialization.py [profiles] [entries]
+"""
+import io
+import json
+import sys
+import time
+from dataclasses import asdict
+
+from linkedin_scraper import Person, serializers
+from linkedin_scraper.objects import Certification, Education, Experience
+
+
+def synthetic_person(entries):
+    text = "lorem ipsum dolor sit amet " * 20
+    return Person(
+        linkedin_url="https://www.linkedin.com/in/someone",
+        name="Some One",
+        about=text,
+        experiences=[
+            Experience(
+                institution_name="Company {}".format(i),
+                linkedin_url="https://www.linkedin.com/company/{}".format(i),
+                from_date="Jan 2020",
+                to_date="Present",
+                duration="4 yrs",
+                position_title="Engineer",
+                location="London",
+                description=text,
+            )
+            for i in range(entries)
+        ],
+        educations=[Education(institution_name="School", degree="BSc", description=text)] * entries,
+        certifications=[Certification(cert_name="Cert", institution_name="Issuer")] * entries,
+        get=False,
+        scrape=False,
+    )
+
+
+def asdict_path(person, fp):
+    json.dump(
+        {
+            "name": person.name,
+            "about": person.about,
+            "experiences": [asdict(exp) for exp in person.experiences],
+            "certifications": [asdict(cert) for cert in person.certifications],
+            "educations": [asdict(edu) for edu in person.educations],
+        },
+        fp,
+    )
+
+
+def serializers_path(person, fp):
+    serializers.dump(person, fp)
+
+
+def timed(path, people):
+    start = time.perf_counter()
+    for person in people:
+        path(person, io.StringIO())
+    return time.perf_counter() - start
+
+
+def main(profiles, entries):
+    people = [synthetic_person(entries) for _ in range(profiles)]
+    baseline = timed(asdict_path, people)
+    streamed = timed(serializers_path, people)
+    print("{} profiles x {} entries per section".format(profiles, entries))
+    print("asdict + json.dump : {:.3f}s".format(baseline))
+    print("serializers.dump   : {:.3f}s ({:.1f}x)".format(streamed, baseline / streamed))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    )
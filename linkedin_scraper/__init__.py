@@ -2,8 +2,9 @@ from os.path import dirname, basename, isfile
 from .person import Person
 from .objects import Institution, Experience, Education, Contact
 from .company import Company
-from .jobs import Job
+from .jobs import Job, hydrate_jobs
 from .job_search import JobSearch
+from .crawler import CompanyCrawler
 
 __version__ = "2.11.5"
 
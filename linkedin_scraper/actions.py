@@ -1,5 +1,17 @@
 import getpass
+import json
+import os
+import queue
+import tempfile
+import threading
+import weakref
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from . import browser
 from . import constants as c
+from . import ratelimit
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -13,14 +25,46 @@ def page_has_loaded(driver):
     page_state = driver.execute_script('return document.readyState;')
     return page_state == 'complete'
 
-def login(driver, email=None, password=None, cookie = None, timeout=10):
+# Drivers known to be signed in, so scrapers don't have to wait for the nav
+# bar on every page to find out.
+_signed_in_drivers = weakref.WeakSet()
+
+def mark_signed_in(driver, signed_in=True):
+    if signed_in:
+        _signed_in_drivers.add(driver)
+    else:
+        _signed_in_drivers.discard(driver)
+
+def known_signed_in(driver):
+    return driver in _signed_in_drivers
+
+def is_login_url(url):
+    return urlsplit(url or "").path.startswith(c.LOGIN_URL_MARKERS)
+
+def is_logged_in(driver, url=c.SIGNED_IN_PROBE_URL, timeout=5):
+    """Cheap signed-in probe: loads `url` once and checks that LinkedIn did not
+    redirect to a login or checkpoint page and that the nav bar shows up
+    within `timeout` seconds."""
+    ratelimit.navigate(driver, url, probe=True)
+    signed_in = not is_login_url(driver.current_url)
+    if signed_in:
+        try:
+            WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CLASS_NAME, c.VERIFY_LOGIN_ID)))
+        except TimeoutException:
+            signed_in = False
+    mark_signed_in(driver, signed_in)
+    return signed_in
+
+def login(driver, email=None, password=None, cookie = None, timeout=10, session=None):
+    if session is not None and session.restore(driver):
+        return
     if cookie is not None:
         return _login_with_cookie(driver, cookie)
   
     if not email or not password:
         email, password = __prompt_email_password()
   
-    driver.get("https://www.linkedin.com/login")
+    ratelimit.navigate(driver, c.SIGNED_OUT_URL)
     element = WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "username")))
   
     email_elem = driver.find_element(By.ID,"username")
@@ -36,10 +80,220 @@ def login(driver, email=None, password=None, cookie = None, timeout=10):
             remember.submit()
   
     element = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CLASS_NAME, c.VERIFY_LOGIN_ID)))
-  
+    mark_signed_in(driver)
+    if session is not None:
+        session.save(driver)
+
 def _login_with_cookie(driver, cookie):
-    driver.get("https://www.linkedin.com/login")
+    ratelimit.navigate(driver, c.SIGNED_OUT_URL)
     driver.add_cookie({
       "name": "li_at",
       "value": cookie
     })
+
+
+class SessionStore:
+    """Keeps the cookie jar of a logged in browser in a JSON file at `path`,
+    so new drivers can be signed in with one navigation instead of a form
+    login. Pass it to `login(..., session=store)`."""
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+
+    def save(self, driver):
+        """Writes the cookies of `driver`, readable by the owner only. Each
+        save goes through its own temporary file, so concurrent savers, even
+        in other processes, never write into the same file."""
+        cookies = driver.get_cookies()
+        with self._lock:
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(cookies, f)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def restore(self, driver):
+        """Adds the saved cookies to `driver` and checks they still sign it in.
+        Returns False if there is no saved session or it has expired."""
+        cookies = self.load()
+        if not cookies:
+            return False
+        ratelimit.navigate(driver, c.SIGNED_OUT_URL)
+        for cookie in cookies:
+            if "expiry" in cookie:
+                cookie["expiry"] = int(cookie["expiry"])
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException:
+                pass
+        return is_logged_in(driver)
+
+
+class StaticPool:
+    """Lends out a fixed list of already logged in drivers, one user at a
+    time each, with the same `lease()` interface as DriverPool."""
+
+    def __init__(self, drivers):
+        self._idle = queue.Queue()
+        for driver in drivers:
+            self._idle.put(driver)
+        self.size = self._idle.qsize()
+        if not self.size:
+            raise ValueError("StaticPool needs at least one driver")
+
+    def __len__(self):
+        return self.size
+
+    @contextmanager
+    def lease(self):
+        driver = self._idle.get()
+        try:
+            yield driver
+        finally:
+            self._idle.put(driver)
+
+
+class DriverPool:
+    """A fixed number of logged in browsers, started up front and lent out one
+    at a time:
+
+        with DriverPool(4, email=email, password=password) as pool:
+            with pool.lease() as driver:
+                person = Person(url, driver=driver, close_on_complete=False)
+
+    Each driver is signed in once, from `session` when it holds a live
+    session, else with `cookie` or `email`/`password`. A driver that stopped
+    responding or was signed out is replaced when it is returned, and every
+    driver is replaced after `max_uses` leases if that is set."""
+
+    def __init__(self, size, driver_factory=browser.lean_chrome, email=None, password=None, cookie=None, session=None, max_uses=None, timeout=None):
+        self.size = size
+        self.driver_factory = driver_factory
+        self.email = email
+        self.password = password
+        self.cookie = cookie
+        self.session = session
+        self.max_uses = max_uses
+        self.timeout = timeout
+        self._idle = queue.Queue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.size
+
+    def _new_driver(self):
+        driver = self.driver_factory()
+        try:
+            login(driver, self.email, self.password, cookie=self.cookie, session=self.session)
+        except Exception:
+            driver.quit()
+            raise
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+
+    def start(self):
+        """Starts and signs in all the drivers, in parallel, unless that was
+        already done. If any of them fails, the others are quit and the error
+        is raised."""
+        with self._start_lock:
+            if self._started:
+                return
+            with ThreadPoolExecutor(self.size) as executor:
+                futures = [executor.submit(self._new_driver) for _ in range(self.size)]
+            drivers = [future.result() for future in futures if future.exception() is None]
+            errors = [future.exception() for future in futures if future.exception() is not None]
+            if errors:
+                for driver in drivers:
+                    self._discard(driver)
+                raise errors[0]
+            for driver in drivers:
+                self._idle.put(driver)
+            self._started = True
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    def healthy(self, driver):
+        try:
+            driver.execute_script("return 1")
+            return not is_login_url(driver.current_url)
+        except WebDriverException:
+            return False
+
+    @contextmanager
+    def lease(self):
+        """Lends an idle driver until the block exits, waiting up to `timeout`
+        seconds (forever if None) for one to be free."""
+        self.start()
+        driver = self._idle.get(timeout=self.timeout)
+        if driver is None:
+            # a slot whose driver could not be replaced earlier
+            try:
+                driver = self._new_driver()
+            except Exception:
+                self._idle.put(None)
+                raise
+        try:
+            yield driver
+        finally:
+            with self._lock:
+                # not owned any more if the pool was closed during the lease
+                owned = driver in self._uses
+            if owned:
+                self._idle.put(self._returned(driver))
+
+    def _returned(self, driver):
+        """The driver to put back in the slot of `driver`: itself, a fresh
+        replacement, or None if the replacement failed to start, so the next
+        lease tries again."""
+        with self._lock:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            worn_out = self.max_uses is not None and self._uses[driver] >= self.max_uses
+        if not worn_out and self.healthy(driver):
+            return driver
+        self._discard(driver)
+        try:
+            return self._new_driver()
+        except Exception:
+            return None
+
+    def close(self):
+        """Quits every driver of the pool, including those still on lease."""
+        with self._start_lock:
+            while True:
+                try:
+                    self._idle.get_nowait()
+                except queue.Empty:
+                    break
+            with self._lock:
+                drivers = list(self._uses)
+            for driver in drivers:
+                self._discard(driver)
+            self._started = False
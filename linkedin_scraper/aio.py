@@ -0,0 +1,69 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+from .actions import StaticPool
+
+DEFAULT_WORKERS = 32
+
+
+class AsyncSession:
+    """Lets coroutines drive the blocking scrapers. Each call runs on a worker
+    thread with a driver leased from `pool` (an actions.DriverPool or a list
+    of logged in drivers), so many scrapes can be awaited from one event loop
+    while each driver still serves one of them at a time.
+
+    Without a pool only browserless fetches can run, such as public company
+    pages over `http` (a backends.HttpBackend, the shared one by default)."""
+
+    def __init__(self, pool=None, http=None, max_workers=None):
+        if pool is not None and not hasattr(pool, "lease"):
+            pool = StaticPool(pool)
+        self.pool = pool
+        self.http = http
+        if max_workers is None:
+            max_workers = len(pool) if pool is not None else DEFAULT_WORKERS
+        self.executor = ThreadPoolExecutor(max_workers)
+        # taken before a thread is used, so no worker ever blocks waiting for
+        # a driver
+        self._slots = asyncio.Semaphore(max_workers)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _lease(self):
+        return self.pool.lease() if self.pool is not None else nullcontext(None)
+
+    def _call(self, func):
+        with self._lease() as driver:
+            return func(driver)
+
+    async def run(self, func):
+        """Runs `func(driver)` on a worker thread and returns its result."""
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            return await loop.run_in_executor(self.executor, self._call, func)
+
+    async def iterate(self, make_iterator):
+        """Yields the items of `make_iterator(driver)`, computing each on a
+        worker thread, and keeps the driver until the iteration ends."""
+        loop = asyncio.get_running_loop()
+        done = object()
+        async with self._slots:
+            lease = self._lease()
+            driver = await loop.run_in_executor(self.executor, lease.__enter__)
+            try:
+                iterator = make_iterator(driver)
+                while True:
+                    item = await loop.run_in_executor(self.executor, next, iterator, done)
+                    if item is done:
+                        return
+                    yield item
+            finally:
+                await loop.run_in_executor(self.executor, lease.__exit__, None, None, None)
+
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
@@ -0,0 +1,74 @@
+from collections import namedtuple
+
+import requests
+from lxml import html
+from requests.adapters import HTTPAdapter
+
+from . import ratelimit
+
+# A fetched page: the URL it ended up on after redirects, and its parsed
+# lxml document.
+FetchedPage = namedtuple("FetchedPage", ["url", "document"])
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class SeleniumBackend:
+    """Loads pages in the browser, running their JavaScript."""
+
+    name = "selenium"
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def fetch(self, url):
+        ratelimit.navigate(self.driver, url)
+        return FetchedPage(
+            self.driver.current_url, html.fromstring(self.driver.page_source)
+        )
+
+
+class HttpBackend:
+    """Downloads pages with a pooled `requests.Session` and parses them with
+    lxml. Only for pages whose content is in the served markup; one instance
+    can be shared between entities and threads."""
+
+    name = "http"
+
+    def __init__(self, session=None, timeout=10, pool_size=10, headers=HEADERS):
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(headers)
+        self.session = session
+        self.timeout = timeout
+
+    def fetch(self, url):
+        # Paced but not reported: signed-out requests are routinely sent to
+        # the authwall, which says nothing about the logged-in browsers that
+        # share the limiter.
+        ratelimit.pace(url)
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return FetchedPage(
+            response.url, html.fromstring(response.content, base_url=response.url)
+        )
+
+
+_http_backend = None
+
+
+def http_backend():
+    """The HttpBackend shared by every entity that does not set its own."""
+    global _http_backend
+    if _http_backend is None:
+        _http_backend = HttpBackend()
+    return _http_backend
@@ -0,0 +1,94 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from . import scripts
+
+# Flags that keep the memory and CPU of each browser down when many run on
+# one machine.
+LEAN_ARGUMENTS = (
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--renderer-process-limit=2",
+    "--js-flags=--max-old-space-size=512",
+)
+
+IMAGE_PATTERNS = ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico")
+FONT_PATTERNS = ("*.woff", "*.woff2", "*.ttf", "*.otf")
+MEDIA_PATTERNS = ("*.mp4", "*.webm", "*.m3u8", "*.mp3", "*dms.licdn.com/playlist*")
+
+# Ad, tracking and analytics hosts the pages load that scraping never needs.
+THIRD_PARTY_HOSTS = (
+    "*doubleclick.net*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*googlesyndication.com*",
+    "*px.ads.linkedin.com*",
+    "*snap.licdn.com*",
+    "*bat.bing.com*",
+    "*connect.facebook.net*",
+    "*demdex.net*",
+    "*omtrdc.net*",
+    "*adsymptotic.com*",
+)
+
+
+def blocked_url_patterns(block_images=True, block_fonts=True, block_media=True, blocked_hosts=THIRD_PARTY_HOSTS):
+    patterns = []
+    if block_images:
+        patterns.extend(IMAGE_PATTERNS)
+    if block_fonts:
+        patterns.extend(FONT_PATTERNS)
+    if block_media:
+        patterns.extend(MEDIA_PATTERNS)
+    patterns.extend(blocked_hosts or ())
+    return patterns
+
+
+def lean_chrome(
+    driver_path=None,
+    headless=True,
+    block_images=True,
+    block_fonts=True,
+    block_media=True,
+    blocked_hosts=THIRD_PARTY_HOSTS,
+    window_size=(1280, 900),
+    arguments=LEAN_ARGUMENTS,
+):
+    """A Chrome driver tuned for scraping: headless, with a capped window,
+    memory friendly flags, and images, fonts, media and `blocked_hosts` never
+    downloaded. Every part can be turned off or replaced by its argument."""
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size={},{}".format(*window_size))
+    for argument in arguments:
+        options.add_argument(argument)
+    if block_images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+
+    service = Service(executable_path=driver_path) if driver_path else None
+    driver = webdriver.Chrome(options=options, service=service)
+
+    patterns = blocked_url_patterns(block_images, block_fonts, block_media, blocked_hosts)
+    if patterns:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    return driver
+
+
+def transferred_bytes(driver):
+    """Bytes transferred over the network for the current page so far, from
+    the page's Resource Timing entries."""
+    return driver.execute_script(scripts.TRANSFERRED_BYTES)
@@ -1,15 +1,14 @@
 import requests
 from lxml import html
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-from .objects import Scraper
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from dataclasses import dataclass
+from . import actions, browser, parsers, serializers
+from .objects import NavigationPlan, Scraper
 from .person import Person
-import time
 import os
-import json
 
 AD_BANNER_CLASSNAME = ('ad-banner-container', '__ad')
 
@@ -32,6 +31,11 @@ class CompanySummary(object):
         else:
             return """ {name} {followers} """.format(name = self.name, followers = self.followers)
 
+@dataclass
+class EmployeeCursor:
+    page: int = 0
+    seen: int = 0
+
 class Company(Scraper):
     linkedin_url = None
     name = None
@@ -44,12 +48,22 @@ class Company(Scraper):
     company_type = None
     company_size = None
     specialties = None
-    showcase_pages = []
-    affiliated_companies = []
-    employees = []
+    showcase_pages = None
+    affiliated_companies = None
+    employees = None
     headcount = None
-
-    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages =[], affiliated_companies = [], driver = None, scrape = True, get_employees = True, close_on_complete = True):
+    HEAVY_FIELDS = ("showcase_pages", "affiliated_companies", "employees")
+    # the pages a logged in scrape visits, and the fields each one provides
+    FIELD_PAGES = {
+        "about": ("name", "about_us", "website", "phone", "headquarters", "founded", "industry", "company_type", "company_size", "specialties", "headcount", "showcase_pages", "affiliated_companies"),
+        "people": ("employees",),
+    }
+    # the page shown when not logged in is static markup, so it is downloaded
+    # over HTTP instead of loaded in the browser
+    PAGE_BACKENDS = {"public": "http"}
+    FIELD_PAGES_ALL = tuple(field for fields in FIELD_PAGES.values() for field in fields)
+
+    def __init__(self, linkedin_url = None, name = None, about_us =None, website = None, phone = None, headquarters = None, founded = None, industry = None, company_type = None, company_size = None, specialties = None, showcase_pages = None, affiliated_companies = None, driver = None, scrape = True, get_employees = True, close_on_complete = True, get = True, fields = None):
         self.linkedin_url = linkedin_url
         self.name = name
         self.about_us = about_us
@@ -61,26 +75,122 @@ class Company(Scraper):
         self.company_type = company_type
         self.company_size = company_size
         self.specialties = specialties
-        self.showcase_pages = showcase_pages
-        self.affiliated_companies = affiliated_companies
+        self.showcase_pages = showcase_pages or []
+        self.affiliated_companies = affiliated_companies or []
+        self.employees = []
+        self.employees_cursor = None
 
-        if driver is None:
+        if driver is None and (get or scrape):
             try:
                 if os.getenv("CHROMEDRIVER") == None:
                     driver_path = os.path.join(os.path.dirname(__file__), 'drivers/chromedriver')
                 else:
                     driver_path = os.getenv("CHROMEDRIVER")
 
-                driver = webdriver.Chrome(driver_path)
+                driver = browser.lean_chrome(driver_path)
             except:
-                driver = webdriver.Chrome()
+                driver = browser.lean_chrome()
 
-        driver.get(linkedin_url)
         self.driver = driver
+        self.navigation = NavigationPlan(driver)
+        self.fields = set(self.FIELD_PAGES_ALL if fields is None else fields)
+
+        if get:
+            # land straight on the first page the scrape needs
+            pages = self.planned_pages(get_employees) if scrape else []
+            self.navigation.visit(self.page_url(pages[0]) if pages else linkedin_url)
 
         if scrape:
             self.scrape(get_employees=get_employees, close_on_complete=close_on_complete)
 
+    @classmethod
+    def from_html(cls, pages, linkedin_url = None):
+        """Builds a Company from saved page sources, without a browser.
+
+        `pages` may hold "main" and "about" (company pages) and "people"."""
+        company = cls(linkedin_url = linkedin_url, get = False, scrape = False)
+        for page in ("main", "about"):
+            if page in pages:
+                company.__apply_fields(parsers.parse_company_page(pages[page]))
+        if "people" in pages:
+            company.employees = parsers.parse_employees(pages["people"])
+        return company
+
+    @classmethod
+    def from_public_page(cls, linkedin_url, http = None):
+        """Builds a Company from the page LinkedIn serves to visitors who are
+        not logged in, fetched over HTTP without a browser. `http` is the
+        HttpBackend to use, the shared one by default."""
+        company = cls(linkedin_url = linkedin_url, get = False, scrape = False)
+        company.http = http
+        company.scrape_not_logged_in(close_on_complete = False, get_employees = False)
+        return company
+
+    @classmethod
+    async def fetch(cls, linkedin_url, session, **kwargs):
+        """Scrapes a company from a coroutine on a driver of `session` (an
+        aio.AsyncSession); `kwargs` are passed on to Company. A session without
+        drivers reads the public page over HTTP instead."""
+        if session.pool is None:
+            return await session.run(lambda driver: cls.from_public_page(linkedin_url, http = session.http))
+        return await session.run(lambda driver: cls(linkedin_url, driver = driver, close_on_complete = False, **kwargs))
+
+    @classmethod
+    def scrape_many(cls, urls, driver = None, sink = None, drop_heavy = False, get_employees = True):
+        """Scrapes `urls` one after another on a single driver and yields each
+        Company as soon as it is done; see `batch` for `sink` and `drop_heavy`.
+        Without `driver`, the browser started for the batch is quit when the
+        iteration ends."""
+        def scraped():
+            nonlocal driver
+            owns_driver = driver is None
+            try:
+                for url in urls:
+                    company = cls(url, driver = driver, get_employees = get_employees, close_on_complete = False)
+                    driver = company.driver
+                    yield company
+            finally:
+                if owns_driver and driver is not None:
+                    driver.quit()
+        return cls.batch(scraped(), sink = sink, drop_heavy = drop_heavy)
+
+    @classmethod
+    def batch(cls, companies, sink = None, drop_heavy = False):
+        """Passes each company to `sink` (if given) before yielding it. With
+        `drop_heavy`, the fields in `HEAVY_FIELDS` are released once the sink
+        has had them, so a long batch holds only the small fields in memory."""
+        for company in companies:
+            if sink is not None:
+                sink(company)
+            if drop_heavy:
+                company.drop_heavy_fields()
+            yield company
+
+    def planned_pages(self, get_employees = True):
+        fields = set(self.fields)
+        if not get_employees:
+            fields.discard("employees")
+        return [page for page, page_fields in self.FIELD_PAGES.items() if fields.intersection(page_fields)]
+
+    def page_url(self, page):
+        return os.path.join(self.linkedin_url, page)
+
+    @property
+    def navigations(self):
+        return self.navigation.count
+
+    def drop_heavy_fields(self):
+        for field in self.HEAVY_FIELDS:
+            setattr(self, field, [])
+        self.employees_cursor = None
+
+    def __apply_fields(self, fields):
+        for key in ("showcase_pages", "affiliated_companies"):
+            if key in fields:
+                fields[key] = [CompanySummary(**card) for card in fields[key]]
+        for attribute, value in fields.items():
+            setattr(self, attribute, value)
+
     def __get_text_under_subtitle(self, elem):
         return "\n".join(elem.text.split("\n")[1:])
 
@@ -97,10 +207,10 @@ class Company(Scraper):
 
         try:
             # print()
-            employee_object = {}
-            employee_object['name'] = (employee_raw.text.split("\n") or [""])[0].strip()
-            employee_object['designation'] = (employee_raw.text.split("\n") or [""])[3].strip()
-            employee_object['linkedin_url'] = employee_raw.find_element(By.TAG_NAME, "a").get_attribute("href")
+            employee_object = parsers.employee_from_text(
+                employee_raw.text,
+                employee_raw.find_element(By.TAG_NAME, "a").get_attribute("href"),
+            )
             # print(employee_raw.text, employee_object)
             # _person = Person(
             #     # linkedin_url = employee_raw.find_element_by_tag_name("a").get_attribute("href"),
@@ -118,130 +228,100 @@ class Company(Scraper):
             # print(e)
             return None
 
-    def get_employees(self, wait_time=10):
-        total = []
+    def __harvest_employees(self, results_list, items_css, start, timeout = 10):
+        """Scrolls the people list and returns the cards from index `start` on,
+        in one in-page call; [] once no new cards arrive."""
+        employees = self.run_async_extractor("harvest_employees", start, 300, 2000, timeout * 1000, timeout = timeout)
+        if employees is not None:
+            return employees
+        self.scroll_until_stable(items_css)
+        results_li = results_list.find_elements(By.TAG_NAME, "li")
+        return [self.__parse_employee__(res) for res in results_li[start:]]
+
+    def iter_employees(self, cursor = None, wait_time = 10):
+        """Yields employees from the people page as each page is harvested.
+
+        `cursor` is advanced as employees are yielded and is also kept on
+        `self.employees_cursor`; passing it back in resumes where it stopped."""
+        if cursor is None:
+            cursor = EmployeeCursor()
+        self.employees_cursor = cursor
         list_css = "list-style-none"
         next_xpath = '//button[@aria-label="Next"]'
         driver = self.driver
 
-        try:
-            see_all_employees = driver.find_element(By.XPATH,'//a[@data-control-name="topcard_see_all_employees"]')
-        except:
-            pass
-        driver.get(os.path.join(self.linkedin_url, "people"))
+        self.navigation.visit(self.page_url("people"))
 
         _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//span[@dir="ltr"]')))
 
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-        time.sleep(1)
-        driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-        time.sleep(1)
-
+        items_css = "." + list_css + " li"
         results_list = driver.find_element(By.CLASS_NAME, list_css)
-        results_li = results_list.find_elements(By.TAG_NAME, "li")
-        for res in results_li:
-            total.append(self.__parse_employee__(res))
-
-        def is_loaded(previous_results):
-          loop = 0
-          driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-          results_li = results_list.find_elements(By.TAG_NAME, "li")
-          while len(results_li) == previous_results and loop <= 5:
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            loop += 1
-          return loop <= 5
-
-        def get_data(previous_results):
-            results_li = results_list.find_elements(By.TAG_NAME, "li")
-            for res in results_li[previous_results:]:
-                total.append(self.__parse_employee__(res))
-
-        results_li_len = len(results_li)
-        while is_loaded(results_li_len):
+
+        start_page = cursor.page
+        page = 0
+        while True:
+            if page < start_page:
+                # pages before the cursor were consumed already, only replay them
+                self.scroll_until_stable(items_css)
+            else:
+                cursor.page = page
+                harvested = 0
+                while True:
+                    employees = self.__harvest_employees(results_list, items_css, cursor.seen, timeout = wait_time)
+                    if not employees:
+                        break
+                    harvested += len(employees)
+                    for employee in employees:
+                        cursor.seen += 1
+                        if employee is not None:
+                            yield employee
+                if not harvested and page > start_page:
+                    break
             try:
                 driver.find_element(By.XPATH,next_xpath).click()
             except:
                 pass
             _ = WebDriverWait(driver, wait_time).until(EC.presence_of_element_located((By.CLASS_NAME, list_css)))
+            page += 1
 
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*2/3));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight*3/4));")
-            time.sleep(1)
-            driver.execute_script("window.scrollTo(0, Math.ceil(document.body.scrollHeight));")
-            time.sleep(1)
-
-            get_data(results_li_len)
-            results_li_len = len(total)
-        return total
-
-
+    def get_employees(self, wait_time=10):
+        return list(self.iter_employees(wait_time = wait_time))
 
     def scrape_logged_in(self, get_employees = True, close_on_complete = True):
         driver = self.driver
+        pages = self.planned_pages(get_employees)
 
-        driver.get(self.linkedin_url)
+        if "about" in pages:
+            self.navigation.visit(self.page_url("about"))
+            self.__scrape_about_page()
 
-        _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.XPATH, '//div[@dir="ltr"]')))
-
-        navigation = driver.find_element(By.CLASS_NAME, "org-page-navigation__items ")
+        if "people" in pages:
+            self.employees = self.get_employees()
 
-        self.name = driver.find_element(By.CLASS_NAME,"org-top-card-summary__title").text.strip()
+        if close_on_complete:
+            driver.close()
 
-        # Click About Tab or View All Link
-        try:
-          self.__find_first_available_element__(
-            navigation.find_elements(By.XPATH, "//a[@data-control-name='page_member_main_nav_about_tab']"),
-            navigation.find_elements(By.XPATH, "//a[@data-control-name='org_about_module_see_all_view_link']"),
-          ).click()
-        except:
-          driver.get(os.path.join(self.linkedin_url, "about"))
+    def __scrape_about_page(self):
+        driver = self.driver
 
         _ = WebDriverWait(driver, 3).until(EC.presence_of_all_elements_located((By.TAG_NAME, 'section')))
-        time.sleep(3)
+        self.wait_until_ready(".org-about-module__margin-bottom dl")
+
+        self.name = driver.find_element(By.CLASS_NAME,"org-top-card-summary__title").text.strip()
 
-        if 'Cookie Policy' in driver.find_elements(By.TAG_NAME, "section")[1].text or any(classname in driver.find_elements(By.TAG_NAME, "section")[1].get_attribute('class') for classname in AD_BANNER_CLASSNAME):
-            section_id = 4
-        else:
-            section_id = 3
-       #section ID is no longer needed, we are using class name now.
-        #grid = driver.find_elements_by_tag_name("section")[section_id]
         grid = driver.find_element(By.CLASS_NAME, "artdeco-card.org-page-details-module__card-spacing.artdeco-card.org-about-module__margin-bottom")
-        print(grid)
-        descWrapper = grid.find_elements(By.TAG_NAME, "p")
-        if len(descWrapper) > 0:
-            self.about_us = descWrapper[0].text.strip()
-        labels = grid.find_elements(By.TAG_NAME, "dt")
-        values = grid.find_elements(By.TAG_NAME, "dd")
-        num_attributes = min(len(labels), len(values))
-        #print("The length of the labels is " + str(len(labels)), "The length of the values is " + str(len(values)))
-        # if num_attributes == 0:
-        #     exit()
-        x_off = 0
-        for i in range(num_attributes):
-            txt = labels[i].text.strip()
-            if txt == 'Website':
-                self.website = values[i+x_off].text.strip()
-            if txt == 'Phone':
-                self.phone = values[i+x_off].text.strip()
-            elif txt == 'Industry':
-                self.industry = values[i+x_off].text.strip()
-            elif txt == 'Company size':
-                self.company_size = values[i+x_off].text.strip()
-                if len(values) > len(labels):
-                    x_off = 1
-            elif txt == 'Headquarters':
-                    self.headquarters = values[i+x_off].text.strip()
-            elif txt == 'Type':
-                self.company_type = values[i+x_off].text.strip()
-            elif txt == 'Founded':
-                self.founded = values[i+x_off].text.strip()
-            elif txt == 'Specialties':
-                self.specialties = "\n".join(values[i+x_off].text.strip().split(", "))
+        about = self.run_extractor("company_about", grid)
+        if about is not None:
+            if about["about_us"] is not None:
+                self.about_us = about["about_us"]
+            labels, values = about["labels"], about["values"]
+        else:
+            descWrapper = grid.find_elements(By.TAG_NAME, "p")
+            if len(descWrapper) > 0:
+                self.about_us = descWrapper[0].text.strip()
+            labels = [label.text for label in grid.find_elements(By.TAG_NAME, "dt")]
+            values = [value.text for value in grid.find_elements(By.TAG_NAME, "dd")]
+        self.__apply_fields(parsers.company_about_fields(labels, values))
 
         try:
             grid = driver.find_element(By.CLASS_NAME, "mt1")
@@ -258,44 +338,47 @@ class Company(Scraper):
 
         try:
             _ = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.CLASS_NAME, 'company-list')))
-            showcase, affiliated = driver.find_elements(By.CLASS_NAME, "company-list")
+        except TimeoutException: # no related companies on this page
+            return
+        try:
             driver.find_element(By.ID,"org-related-companies-module__show-more-btn").click()
-
-            # get showcase
-            for showcase_company in showcase.find_elements(By.CLASS_NAME, "org-company-card"):
-                companySummary = CompanySummary(
-                        linkedin_url = showcase_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
-                        name = showcase_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
-                        followers = showcase_company.find_element(By.CLASS_NAME, "company-followers-count").text.strip()
-                    )
-                self.showcase_pages.append(companySummary)
-
-            # affiliated company
-
-            for affiliated_company in showcase.find_element(By.CLASS_NAME, "org-company-card"):
-                companySummary = CompanySummary(
-                         linkedin_url = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").get_attribute("href"),
-                        name = affiliated_company.find_element(By.CLASS_NAME, "company-name-link").text.strip(),
-                        followers = affiliated_company.find_element(By.CLASS_NAME, "company-followers-count").text.strip()
-                        )
-                self.affiliated_companies.append(companySummary)
-
-        except:
+            self.wait_until_ready(".company-list")
+        except NoSuchElementException: # everything is already shown
             pass
+        self.__apply_fields(parsers.parse_related_companies(self.page_snapshot()))
 
-        if get_employees:
-            self.employees = self.get_employees()
-
-        driver.get(self.linkedin_url)
-
-        if close_on_complete:
-            driver.close()
+    def __scrape_public_page(self):
+        """Fetches the public page with the "public" backend and parses its
+        markup; returns whether it yielded the company."""
+        if self.backend("public").name == "selenium" and self.driver is None:
+            return False
+        try:
+            page = self.fetch_page(self.linkedin_url, "public")
+        except requests.RequestException:
+            return False
+        if actions.is_login_url(page.url):
+            return False
+        fields = parsers.parse_public_company_page(page.document)
+        if not fields.get("name"):
+            return False
+        self.__apply_fields(fields)
+        return True
 
     def scrape_not_logged_in(self, close_on_complete = True, retry_limit = 10, get_employees = True):
         driver = self.driver
+        if self.__scrape_public_page():
+            if get_employees and driver is not None:
+                self.employees = self.get_employees()
+            if close_on_complete and driver is not None:
+                driver.close()
+            return
+        if driver is None:
+            raise ValueError("could not read the public page of {} without a browser".format(self.linkedin_url))
+
         retry_times = 0
+        self.navigation.visit(self.linkedin_url)
         while self.is_signed_in() and retry_times <= retry_limit:
-            page = driver.get(self.linkedin_url)
+            self.navigation.visit(self.linkedin_url, reload = True)
             retry_times = retry_times + 1
 
         self.name = driver.find_element(By.CLASS_NAME, "name").text.strip()
@@ -346,25 +429,11 @@ class Company(Scraper):
         if get_employees:
             self.employees = self.get_employees()
 
-        driver.get(self.linkedin_url)
-
         if close_on_complete:
             driver.close()
 
+    def to_dict(self):
+        return serializers.to_dict(self)
+
     def __repr__(self):
-        _output = {}
-        _output['name'] = self.name
-        _output['about_us'] = self.about_us
-        _output['specialties'] = self.specialties
-        _output['website'] = self.website
-        _output['phone'] = self.phone
-        _output['industry'] = self.industry
-        _output['company_type'] = self.name
-        _output['headquarters'] = self.headquarters
-        _output['company_size'] = self.company_size
-        _output['founded'] = self.founded
-        _output['affiliated_companies'] = self.affiliated_companies
-        _output['employees'] = self.employees
-        _output['headcount'] = self.headcount
-        
-        return json.dumps(_output).replace('\n', '')
+        return "<Company {name} ({employees} employees)>".format(name = self.name, employees = len(self.employees))
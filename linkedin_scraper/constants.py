@@ -1,2 +1,6 @@
 VERIFY_LOGIN_ID = "global-nav__primary-link"
 REMEMBER_PROMPT = 'remember-me-prompt__form-primary'
+# Path prefixes LinkedIn redirects to when the session is not (or no longer) signed in.
+LOGIN_URL_MARKERS = ("/login", "/checkpoint/", "/authwall", "/uas/login")
+SIGNED_IN_PROBE_URL = "https://www.linkedin.com/feed/"
+SIGNED_OUT_URL = "https://www.linkedin.com/login"
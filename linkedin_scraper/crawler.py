@@ -0,0 +1,121 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+from .company import Company
+
+COMPANY_PATHS = ("company", "showcase")
+
+
+def canonical_company_url(url):
+    """Reduces a company or showcase page URL to
+    https://www.linkedin.com/<company|showcase>/<slug>/, or None if `url` is
+    not one."""
+    if not url:
+        return None
+    parts = urlsplit(url)
+    if not parts.netloc.endswith("linkedin.com"):
+        return None
+    path = [part for part in parts.path.split("/") if part]
+    if len(path) < 2 or path[0] not in COMPANY_PATHS:
+        return None
+    return "https://www.linkedin.com/{}/{}/".format(path[0], path[1].lower())
+
+
+class CompanyCrawler:
+    """Scrapes seed companies and the showcase and affiliated companies they
+    link to, up to `depth` links away, on `workers` drivers at once.
+
+    `driver_factory` is called once per worker thread and must return a
+    logged in driver; the drivers are quit when the crawl ends. Each company
+    URL is scraped at most once, and failures are kept in `errors`."""
+
+    FOLLOW = ("showcase_pages", "affiliated_companies")
+
+    def __init__(
+        self,
+        seeds,
+        driver_factory,
+        depth=1,
+        workers=4,
+        get_employees=False,
+        follow=FOLLOW,
+    ):
+        self.seeds = seeds
+        self.driver_factory = driver_factory
+        self.depth = depth
+        self.workers = workers
+        self.get_employees = get_employees
+        self.follow = follow
+        self.seen = set()
+        self.errors = {}
+        self._local = threading.local()
+        self._drivers = []
+        self._drivers_lock = threading.Lock()
+
+    def __iter__(self):
+        return self.crawl()
+
+    def _driver(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = self._local.driver = self.driver_factory()
+            with self._drivers_lock:
+                self._drivers.append(driver)
+        return driver
+
+    def _scrape(self, url):
+        return Company(
+            url,
+            driver=self._driver(),
+            get_employees=self.get_employees,
+            close_on_complete=False,
+        )
+
+    def _claim(self, url):
+        url = canonical_company_url(url)
+        if url is None or url in self.seen:
+            return None
+        self.seen.add(url)
+        return url
+
+    def links(self, company):
+        for field in self.follow:
+            for summary in getattr(company, field) or []:
+                yield summary.linkedin_url
+
+    def crawl(self):
+        """Yields each Company as soon as it has been scraped."""
+        executor = ThreadPoolExecutor(self.workers)
+        pending = {}
+        try:
+            for seed in self.seeds:
+                url = self._claim(seed)
+                if url is not None:
+                    pending[executor.submit(self._scrape, url)] = (url, 0)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url, depth = pending.pop(future)
+                    try:
+                        company = future.result()
+                    except Exception as e:
+                        self.errors[url] = e
+                        continue
+                    if depth < self.depth:
+                        for link in self.links(company):
+                            link = self._claim(link)
+                            if link is not None:
+                                pending[executor.submit(self._scrape, link)] = (
+                                    link,
+                                    depth + 1,
+                                )
+                    yield company
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            for driver in self._drivers:
+                driver.quit()
+            self._drivers = []
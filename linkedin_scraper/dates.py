@@ -0,0 +1,176 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+# Profiles repeat a small set of date strings across many rows, so every
+# parser here is memoized.
+CACHE_SIZE = 8192
+
+MONTHS = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+
+CURRENT = ("present", "now", "current")
+
+DateRange = namedtuple(
+    "DateRange",
+    ["start_year", "start_month", "end_year", "end_month", "is_current", "months"],
+)
+
+_RANGE_SEPARATOR = re.compile(r"\s+[-\u2013\u2014]\s+")
+_DURATION_PART = re.compile(r"(\d+)\s*(yrs?|years?|mos?|months?)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_work_times(work_times):
+    """Splits "Jan 2020 - Present · 4 yrs 2 mos" into
+    ("Jan 2020", "Present", "4 yrs 2 mos") and "2019 - 2020" into
+    ("2019", "2020", None)."""
+    if work_times:
+        parts = work_times.split("·")
+        times = parts[0].strip() if parts else ""
+        duration = parts[1].strip() if len(parts) > 1 else None
+    else:
+        times = ""
+        duration = None
+
+    dates = _RANGE_SEPARATOR.split(times, maxsplit=1)
+    from_date = dates[0].strip()
+    to_date = dates[1].strip() if len(dates) > 1 else ""
+    return from_date, to_date, duration
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_education_times(times):
+    """Splits "2015 - 2019" into ("2015", "2019")."""
+    from_date = None
+    to_date = None
+    if times and "-" in times:
+        split_times = times.split(" ")
+        dash_index = split_times.index("-") if "-" in split_times else -1
+        if dash_index > 0:
+            from_date = split_times[dash_index - 1]
+        if dash_index < len(split_times) - 1:
+            to_date = split_times[-1]
+    return from_date, to_date
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_certification_dates(date_text):
+    """Splits "Issued Jan 2020 · Expires Jan 2023" into ("Jan 2020", "Jan 2023")."""
+    if date_text is None:
+        return None, None
+    issued_date = ""
+    expired_date = ""
+    for part in date_text.split("·"):
+        part = part.strip()
+        if part.startswith("Issued"):
+            issued_date = part.replace("Issued", "").strip()
+        elif part.startswith("Expires") or part.startswith("Expired"):
+            expired_date = part.replace("Expires", "").replace("Expired", "").strip()
+    return issued_date, expired_date
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_date(text):
+    """Parses "Jan 2020" into (2020, 1) and "2020" into (2020, None).
+
+    Returns None for empty, "Present" or unrecognised text."""
+    if not text:
+        return None
+    year = None
+    month = None
+    for token in text.replace(",", " ").split():
+        token = token.lower().rstrip(".")
+        if token.isdigit() and len(token) == 4:
+            year = int(token)
+        elif token in MONTHS:
+            month = MONTHS[token]
+    if year is None:
+        return None
+    return year, month
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_duration(text):
+    """Parses "4 yrs 2 mos" into 50 months; None if there is no count in it."""
+    if not text:
+        return None
+    if text.strip().lower() == "less than a year":
+        return 0
+    parts = _DURATION_PART.findall(text)
+    if not parts:
+        return None
+    return sum(
+        int(count) * (12 if unit.lower().startswith("y") else 1)
+        for count, unit in parts
+    )
+
+
+def month_span(start, end):
+    """Inclusive number of months between two parsed dates, as LinkedIn
+    counts them ("Jan 2020 - Jan 2020" is one month). A date without a month
+    covers its whole year, so "2020 - 2020" is twelve months."""
+    if start is None or end is None:
+        return None
+    (start_year, start_month), (end_year, end_month) = start, end
+    start_month = start_month or 1
+    end_month = end_month or 12
+    return (end_year - start_year) * 12 + end_month - start_month + 1
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_date_range(from_date, to_date=None, duration=None):
+    start = parse_date(from_date)
+    end = parse_date(to_date)
+    is_current = bool(to_date) and to_date.strip().lower() in CURRENT
+    months = parse_duration(duration)
+    if months is None:
+        months = month_span(start, end)
+    return DateRange(
+        start[0] if start else None,
+        start[1] if start else None,
+        end[0] if end else None,
+        end[1] if end else None,
+        is_current,
+        months,
+    )
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_work_times(work_times):
+    """Parses "Jan 2020 - Present · 4 yrs 2 mos" into a DateRange."""
+    return parse_date_range(*split_work_times(work_times))
+
+
+def record_date_range(record):
+    """The DateRange of an Experience, Education or Certification (or any of
+    their compact variants)."""
+    if hasattr(record, "issued_date"):
+        return parse_date_range(record.issued_date, record.expired_date)
+    return parse_date_range(
+        record.from_date, record.to_date, getattr(record, "duration", None)
+    )
+
+
+def normalize(records):
+    """DateRanges of a whole list of records, in the same order."""
+    return [record_date_range(record) for record in records]
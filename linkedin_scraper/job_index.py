@@ -0,0 +1,92 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+IndexEntry = namedtuple("IndexEntry", ["job_id", "fingerprint", "first_seen", "last_seen"])
+
+NEW = "new"
+CHANGED = "changed"
+
+
+def fingerprint(job):
+    """A digest of the fields shown on a search result card, so a posting
+    that was edited since it was last seen can be told apart."""
+    card = "\x1f".join(str(value or "") for value in (job.job_title, job.company, job.location))
+    return hashlib.sha1(card.encode("utf-8")).hexdigest()
+
+
+class JobIndex:
+    """Persistent record of the job postings seen so far, keyed by posting ID,
+    with the time each was first and last seen (seconds since the epoch).
+
+    `path` is an sqlite database file; ":memory:" keeps the index for the
+    life of the object only."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, fingerprint TEXT, "
+                "first_seen REAL NOT NULL, last_seen REAL NOT NULL)"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __contains__(self, job_id):
+        return self.get(job_id) is not None
+
+    def get(self, job_id):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT job_id, fingerprint, first_seen, last_seen FROM jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        return IndexEntry(*row) if row else None
+
+    def check(self, job):
+        """Compares `job` with the index without recording it. Returns
+        (status, fingerprint), where status is NEW or CHANGED when the posting
+        is not in the index or its card differs from last time, else None.
+
+        Jobs without a posting ID are always reported as NEW."""
+        digest = fingerprint(job)
+        if job.job_id is None:
+            return NEW, digest
+        entry = self.get(job.job_id)
+        if entry is None:
+            return NEW, digest
+        return (CHANGED if entry.fingerprint != digest else None), digest
+
+    def record(self, job_id, digest, now=None):
+        """Stores that the posting `job_id` was seen with the card `digest`."""
+        now = time.time() if now is None else now
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET fingerprint = excluded.fingerprint, "
+                "last_seen = excluded.last_seen",
+                (job_id, digest, now, now),
+            )
+
+    def observe(self, job, now=None):
+        """Checks `job` against the index, as `check`, and records it."""
+        status, digest = self.check(job)
+        if job.job_id is not None:
+            self.record(job.job_id, digest, now)
+        return status
+
+    def close(self):
+        self._connection.close()
@@ -1,11 +1,11 @@
 import os
-from typing import List
-from time import sleep
+from datetime import timedelta
+from typing import AsyncIterator, Iterator, List
 import urllib.parse
 
 from .objects import Scraper
 from . import constants as c
-from .jobs import Job
+from .jobs import Job, hydrate_jobs
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
@@ -15,6 +15,12 @@ from selenium.webdriver.common.keys import Keys
 
 class JobSearch(Scraper):
     AREAS = ["recommended_jobs", None, "still_hiring", "more_jobs"]
+    PAGE_SIZE = 25
+    POSTED_WITHIN = {"day": 86400, "week": 604800, "month": 2592000}
+    WORK_TYPES = {"onsite": 1, "remote": 2, "hybrid": 3}
+    # how long a results page may take to show its first cards
+    RESULTS_TIMEOUT = 20
+    NO_RESULTS_CLASS = "jobs-search-no-results-banner"
 
     def __init__(self, driver, base_url="https://www.linkedin.com/jobs/", close_on_complete=False, scrape=True, scrape_recommended_jobs=True):
         super().__init__()
@@ -36,56 +42,134 @@ class JobSearch(Scraper):
         job_div = self.wait_for_element_to_load(name="job-card-list__title", base=base_element)
         job_title = job_div.text.strip()
         linkedin_url = job_div.get_attribute("href")
-        company = base_element.find_element_by_class_name("artdeco-entity-lockup__subtitle").text
-        location = base_element.find_element_by_class_name("job-card-container__metadata-wrapper").text
+        company = base_element.find_element(By.CLASS_NAME, "artdeco-entity-lockup__subtitle").text
+        location = base_element.find_element(By.CLASS_NAME, "job-card-container__metadata-wrapper").text
         job = Job(linkedin_url=linkedin_url, job_title=job_title, company=company, location=location, scrape=False, driver=self.driver)
         return job
 
+    def scrape_job_cards(self, base_element, class_name) -> List[Job]:
+        cards = self.run_extractor("job_cards", base_element, "." + class_name)
+        if cards is None:
+            return [
+                self.scrape_job_card(job_card)
+                for job_card in base_element.find_elements(By.CLASS_NAME, class_name)
+            ]
+        return [Job(scrape=False, driver=self.driver, **card) for card in cards]
+
 
     def scrape_logged_in(self, close_on_complete=True, scrape_recommended_jobs=True):
         driver = self.driver
-        driver.get(self.base_url)
+        self.navigate(self.base_url)
         if scrape_recommended_jobs:
-            self.focus()
-            sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+            self.wait_until_ready(".scaffold-finite-scroll__content .artdeco-card")
             job_area = self.wait_for_element_to_load(name="scaffold-finite-scroll__content")
             areas = self.wait_for_all_elements_to_load(name="artdeco-card", base=job_area)
             for i, area in enumerate(areas):
                 area_name = self.AREAS[i]
                 if not area_name:
                     continue
-                area_results = []
-                for job_posting in area.find_elements_by_class_name("jobs-job-board-list__item"):
-                    job = self.scrape_job_card(job_posting)
-                    area_results.append(job)
-                setattr(self, area_name, area_results)
+                setattr(self, area_name, self.scrape_job_cards(area, "jobs-job-board-list__item"))
         return
 
 
-    def search(self, search_term: str) -> List[Job]:
-        url = os.path.join(self.base_url, "search") + f"?keywords={urllib.parse.quote(search_term)}&refresh=true"
-        self.driver.get(url)
+    @classmethod
+    async def aiter_search(cls, search_term: str, session, **kwargs) -> AsyncIterator[Job]:
+        """`iter_search` for coroutines, on one driver of `session` (an
+        aio.AsyncSession) for the whole search."""
+        async for job in session.iterate(
+            lambda driver: cls(driver=driver, scrape=False).iter_search(search_term, **kwargs)
+        ):
+            yield job
+
+    def search_url(self, search_term: str, location=None, posted_within=None, remote=None, start=0) -> str:
+        """The results URL for `search_term`. `posted_within` is one of
+        POSTED_WITHIN, a number of seconds or a timedelta; `remote` is True or
+        one of WORK_TYPES."""
+        params = {"keywords": search_term, "refresh": "true"}
+        if location:
+            params["location"] = location
+        if posted_within:
+            if isinstance(posted_within, timedelta):
+                posted_within = posted_within.total_seconds()
+            params["f_TPR"] = f"r{int(self.POSTED_WITHIN.get(posted_within, posted_within))}"
+        if remote:
+            params["f_WT"] = self.WORK_TYPES["remote" if remote is True else remote]
+        if start:
+            params["start"] = start
+        return os.path.join(self.base_url, "search") + "?" + urllib.parse.urlencode(params, quote_via=urllib.parse.quote)
+
+    def search_page(self, url) -> List[Job]:
+        """Loads one results page and returns its job cards, or [] if LinkedIn
+        says the page has no results. Raises TimeoutException if neither shows
+        up within RESULTS_TIMEOUT seconds."""
+        self.navigate(url)
         self.scroll_to_bottom()
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
 
         job_listing_class_name = "jobs-search-results-list"
+        cards_selector = "." + job_listing_class_name + " .job-card-list"
+        WebDriverWait(self.driver, self.RESULTS_TIMEOUT).until(
+            EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, cards_selector)),
+                EC.presence_of_element_located((By.CLASS_NAME, self.NO_RESULTS_CLASS)),
+            )
+        )
+        if self.__find_element_by_class_name__(self.NO_RESULTS_CLASS):
+            return []
+        self.wait_until_ready(cards_selector)
         job_listing = self.wait_for_element_to_load(name=job_listing_class_name)
 
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.3)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
-
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 0.6)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+        self.scroll_until_stable(".job-card-list", container="." + job_listing_class_name)
 
-        self.scroll_class_name_element_to_page_percent(job_listing_class_name, 1)
-        self.focus()
-        sleep(self.WAIT_FOR_ELEMENT_TIMEOUT)
+        self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing)
+        return self.scrape_job_cards(job_listing, "job-card-list")
 
-        job_results = []
-        for job_card in self.wait_for_all_elements_to_load(name="job-card-list", base=job_listing):
-            job = self.scrape_job_card(job_card)
-            job_results.append(job)
-        return job_results
+    def search(self, search_term: str) -> List[Job]:
+        return self.search_page(self.search_url(search_term))
+
+    def iter_search(self, search_term: str, location=None, posted_within=None, remote=None, max_results=None) -> Iterator[Job]:
+        """Yields the job cards of every results page in turn, until a page
+        brings no new postings or `max_results` jobs have been yielded."""
+        seen = set()
+        count = 0
+        start = 0
+        while True:
+            url = self.search_url(search_term, location=location, posted_within=posted_within, remote=remote, start=start)
+            new_jobs = 0
+            for job in self.search_page(url):
+                key = job.job_id or urllib.parse.urlsplit(job.linkedin_url or "").path
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_jobs += 1
+                count += 1
+                yield job
+                if max_results is not None and count >= max_results:
+                    return
+            if not new_jobs:
+                return
+            start += self.PAGE_SIZE
+
+    def poll(self, search_term: str, index, pool=None, max_results=None, **filters) -> Iterator[Job]:
+        """Runs the whole `iter_search` and yields only the postings that
+        `index` (a JobIndex) has not seen before or whose card changed since.
+        Known postings are only marked as seen again.
+
+        With a `pool` of logged in drivers the postings are hydrated with
+        `hydrate_jobs` first, so detail pages are loaded for new and changed
+        postings only; the search is over before the pool is used. A posting
+        is recorded in the index only once it is yielded, so one that failed
+        to hydrate is reported again by the next poll."""
+        fresh = []
+        for job in self.iter_search(search_term, max_results=max_results, **filters):
+            status, digest = index.check(job)
+            if status is None:
+                index.record(job.job_id, digest)
+            else:
+                fresh.append((job, digest))
+
+        digests = {id(job): digest for job, digest in fresh}
+        jobs = [job for job, _ in fresh]
+        for job in jobs if pool is None else hydrate_jobs(jobs, pool):
+            if job.job_id is not None:
+                index.record(job.job_id, digests[id(job)])
+            yield job
@@ -1,13 +1,40 @@
+import re
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from selenium.common.exceptions import TimeoutException
 
+from . import actions, parsers, serializers
 from .objects import Scraper
 from . import constants as c
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+_JOB_VIEW_PATH = re.compile(r"/jobs/view/(?:[^/]*-)?(\d+)/?$")
+
+
+def job_id_from_url(url):
+    """The numeric posting ID in a /jobs/view/<id> or ?currentJobId=<id> URL,
+    as a string, or None."""
+    if not url:
+        return None
+    parts = urllib.parse.urlsplit(url)
+    match = _JOB_VIEW_PATH.search(parts.path)
+    if match:
+        return match.group(1)
+    job_id = urllib.parse.parse_qs(parts.query).get("currentJobId")
+    if job_id and job_id[0].isdigit():
+        return job_id[0]
+    return None
+
 
 class Job(Scraper):
+    # Elements that many postings lack; they are probed for instead of waited on.
+    OPTIONAL_ELEMENTS = {
+        "applicant_count": "jobs-unified-top-card__applicant-count",
+        "benefits": "jobs-unified-description__salary-main-rail-card",
+    }
 
     def __init__(
         self,
@@ -39,6 +66,26 @@ class Job(Scraper):
         if scrape:
             self.scrape(close_on_complete)
 
+    @classmethod
+    async def fetch(cls, linkedin_url, session):
+        """Scrapes a job posting from a coroutine on a driver of `session` (an
+        aio.AsyncSession)."""
+        return await session.run(
+            lambda driver: cls(linkedin_url, driver=driver, close_on_complete=False)
+        )
+
+    @classmethod
+    def from_html(cls, page, linkedin_url=None):
+        """Builds a Job from a saved job posting page, without a browser."""
+        job = cls(linkedin_url=linkedin_url, scrape=False)
+        for attribute, value in parsers.parse_job(page).items():
+            setattr(job, attribute, value)
+        return job
+
+    @property
+    def job_id(self):
+        return job_id_from_url(self.linkedin_url)
+
     def __repr__(self):
         return f"<Job {self.job_title} {self.company}>"
 
@@ -49,45 +96,72 @@ class Job(Scraper):
             raise NotImplemented("This part is not implemented yet")
 
     def to_dict(self):
-        return {
-            "linkedin_url": self.linkedin_url,
-            "job_title": self.job_title,
-            "company": self.company,
-            "company_linkedin_url": self.company_linkedin_url,
-            "location": self.location,
-            "posted_date": self.posted_date,
-            "applicant_count": self.applicant_count,
-            "job_description": self.job_description,
-            "benefits": self.benefits
-        }
+        return serializers.to_dict(self)
 
+    def optional_text(self, key, present):
+        """Text of the optional element OPTIONAL_ELEMENTS[key], or None. When
+        `present` (a probe result) says it is missing, no wait is made."""
+        if present is not None and not present.get(key):
+            return None
+        try:
+            return self.wait_for_element_to_load(name=self.OPTIONAL_ELEMENTS[key]).text.strip()
+        except TimeoutException:
+            return None
 
     def scrape_logged_in(self, close_on_complete=True):
         driver = self.driver
         
-        driver.get(self.linkedin_url)
-        self.focus()
+        self.navigate(self.linkedin_url)
+        self.wait_until_ready(".job-details-jobs-unified-top-card__job-title")
         self.job_title = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__job-title").text.strip()
-        self.company = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").text.strip()
-        self.company_linkedin_url = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name").find_element(By.TAG_NAME,"a").get_attribute("href")
+        company_elem = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__company-name")
+        self.company = company_elem.text.strip()
+        self.company_linkedin_url = company_elem.find_element(By.TAG_NAME,"a").get_attribute("href")
         primary_descriptions = self.wait_for_element_to_load(name="job-details-jobs-unified-top-card__primary-description-container").find_elements(By.TAG_NAME, "span")
         texts = [span.text for span in primary_descriptions if span.text.strip() != ""]
         self.location = texts[0]
         self.posted_date = texts[3]
         
-        try:
-            self.applicant_count = self.wait_for_element_to_load(name="jobs-unified-top-card__applicant-count").text.strip()
-        except TimeoutException:
-            self.applicant_count = 0
         job_description_elem = self.wait_for_element_to_load(name="jobs-description")
         self.mouse_click(job_description_elem.find_element(By.TAG_NAME, "button"))
         job_description_elem = self.wait_for_element_to_load(name="jobs-description")
         job_description_elem.find_element(By.TAG_NAME, "button").click()
         self.job_description = job_description_elem.text.strip()
-        try:
-            self.benefits = self.wait_for_element_to_load(name="jobs-unified-description__salary-main-rail-card").text.strip()
-        except TimeoutException:
-            self.benefits = None
+
+        # probed only once the required anchors (title and description) are in
+        # the page, since the optional elements render alongside them
+        present = self.probe(self.OPTIONAL_ELEMENTS)
+        self.applicant_count = self.optional_text("applicant_count", present) or 0
+        self.benefits = self.optional_text("benefits", present)
 
         if close_on_complete:
             driver.close()
+
+def hydrate_jobs(jobs, pool, errors=None):
+    """Scrapes the details of `jobs` (e.g. search result cards) on `pool`, a
+    list of logged in drivers or an `actions.DriverPool`, one job per driver
+    at a time, and yields each job as soon as it is filled in. The drivers
+    are left open.
+
+    If `errors` is a dict, jobs that fail are recorded there by
+    posting URL with their exception instead of stopping the others."""
+    if not hasattr(pool, "lease"):
+        pool = actions.StaticPool(pool)
+
+    def hydrate(job):
+        with pool.lease() as driver:
+            job.driver = driver
+            job.scrape_logged_in(close_on_complete=False)
+        return job
+
+    with ThreadPoolExecutor(len(pool)) as executor:
+        futures = {executor.submit(hydrate, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                if errors is None:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                errors[futures[future].linkedin_url] = e
@@ -1,11 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, make_dataclass
+from functools import lru_cache
 from time import sleep
 
+from lxml import html
 from selenium.webdriver import Chrome
 
+from . import actions
+from . import backends
 from . import constants as c
+from . import ratelimit
+from . import scripts
 
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -80,19 +87,150 @@ class Accomplishment(Institution):
     title = None
 
 
+@lru_cache(maxsize=None)
+def compact_record_type(record_type, frozen=False):
+    """A `__slots__` dataclass with the same fields and defaults as
+    `record_type`, optionally frozen.
+
+    Instances have no per-instance `__dict__`, which matters when millions of
+    records are held in memory at once."""
+    compact_type = make_dataclass(
+        ("Frozen" if frozen else "Compact") + record_type.__name__,
+        [
+            (record_field.name, record_field.type, field(default=record_field.default))
+            for record_field in fields(record_type)
+        ],
+        frozen=frozen,
+        slots=True,
+    )
+    compact_type.__module__ = __name__
+    return compact_type
+
+
+def compact(record, frozen=False):
+    """Copies a record into its `compact_record_type` counterpart."""
+    record_type = compact_record_type(type(record), frozen)
+    return record_type(
+        **{
+            record_field.name: getattr(record, record_field.name)
+            for record_field in fields(record)
+        }
+    )
+
+
+CompactContact = compact_record_type(Contact)
+CompactSkill = compact_record_type(Skill)
+CompactLanguage = compact_record_type(Language)
+CompactExperience = compact_record_type(Experience)
+CompactCertification = compact_record_type(Certification)
+CompactEducation = compact_record_type(Education)
+
+
+class NavigationPlan:
+    """Routes an entity's page loads so each URL is loaded at most once in a
+    row, and counts the navigations actually made."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.current_url = None
+        self.count = 0
+
+    def visit(self, url, reload=False):
+        """Loads `url` unless it is already the current page; returns whether
+        a navigation happened."""
+        if not reload and self.current_url is not None and (
+            self.current_url.rstrip("/") == url.rstrip("/")
+        ):
+            return False
+        ratelimit.navigate(self.driver, url)
+        self.current_url = url
+        self.count += 1
+        return True
+
+
 @dataclass
 class Scraper:
     driver: Chrome = None
     WAIT_FOR_ELEMENT_TIMEOUT = 5
+    SCROLL_TIMEOUT = 30
+    EXTRACTORS = {
+        "experiences": scripts.EXTRACT_EXPERIENCES,
+        "educations": scripts.EXTRACT_EDUCATIONS,
+        "certifications": scripts.EXTRACT_CERTIFICATIONS,
+        "job_cards": scripts.EXTRACT_JOB_CARDS,
+        "company_about": scripts.EXTRACT_COMPANY_ABOUT,
+        "harvest_employees": scripts.HARVEST_EMPLOYEES,
+        "probe_classes": scripts.PROBE_CLASSES,
+    }
     TOP_CARD = "pv-top-card"
+    # page type -> name of the backend that fetches it; pages not listed are
+    # loaded in the browser
+    PAGE_BACKENDS = {}
+    # the HttpBackend to use instead of the shared one
+    http = None
 
     @staticmethod
     def wait(duration):
         sleep(int(duration))
 
     def focus(self):
-        self.driver.execute_script('alert("Focus window")')
-        self.driver.switch_to.alert.accept()
+        self.driver.switch_to.window(self.driver.current_window_handle)
+
+    def navigate(self, url):
+        """Loads `url` in the browser, paced by the installed
+        `ratelimit.RateLimiter` if there is one."""
+        ratelimit.navigate(self.driver, url)
+
+    def backend(self, page_type=None):
+        """The fetch backend for pages of `page_type`, per PAGE_BACKENDS."""
+        if self.PAGE_BACKENDS.get(page_type) == backends.HttpBackend.name:
+            return self.http or backends.http_backend()
+        return backends.SeleniumBackend(self.driver)
+
+    def fetch_page(self, url, page_type=None):
+        """Loads `url` with the backend for `page_type` and returns the
+        FetchedPage."""
+        return self.backend(page_type).fetch(url)
+
+    def wait_until_ready(self, selector=None, quiet=0.5, timeout=None):
+        """Blocks until `selector` (CSS) is present and the DOM has not changed
+        for `quiet` seconds, for at most `timeout` seconds.
+
+        Returns False if the page was still not ready when the timeout hit."""
+        timeout = self.WAIT_FOR_ELEMENT_TIMEOUT if timeout is None else timeout
+        self.driver.set_script_timeout(timeout + 1)
+        return self.driver.execute_async_script(
+            scripts.WAIT_UNTIL_READY, selector, int(quiet * 1000), int(timeout * 1000)
+        )
+
+    def run_extractor(self, name, *args):
+        """Runs the in-page extraction script registered as `name` and returns
+        its JSON result, or None if the script failed so callers can fall back
+        to walking the DOM element by element."""
+        try:
+            return self.driver.execute_script(self.EXTRACTORS[name], *args)
+        except WebDriverException:
+            return None
+
+    def run_async_extractor(self, name, *args, timeout=None):
+        """Like `run_extractor`, for scripts that wait in the page and report
+        through the `execute_async_script` callback."""
+        timeout = self.SCROLL_TIMEOUT if timeout is None else timeout
+        try:
+            self.driver.set_script_timeout(timeout + 1)
+            return self.driver.execute_async_script(self.EXTRACTORS[name], *args)
+        except WebDriverException:
+            return None
+
+    def probe(self, class_names):
+        """Checks which of `class_names` ({key: class name}) are present in the
+        page in a single call. Returns {key: bool}, or None if the probe
+        could not run."""
+        return self.run_extractor("probe_classes", class_names)
+
+    def page_snapshot(self):
+        """Captures the current page in one round-trip for in-process parsing."""
+        return html.fromstring(self.driver.page_source)
 
     def mouse_click(self, elem):
         action = webdriver.ActionChains(self.driver)
@@ -113,6 +251,14 @@ class Scraper:
         )
 
     def is_signed_in(self):
+        """Whether the driver is signed in. Once known, the answer is cached
+        per driver and only checked again after a page lands on a login or
+        checkpoint URL."""
+        if actions.is_login_url(self.driver.current_url):
+            actions.mark_signed_in(self.driver, False)
+            return False
+        if actions.known_signed_in(self.driver):
+            return True
         try:
             WebDriverWait(self.driver, self.WAIT_FOR_ELEMENT_TIMEOUT).until(
                 EC.presence_of_element_located(
@@ -124,6 +270,7 @@ class Scraper:
             )
 
             self.driver.find_element(By.CLASS_NAME, c.VERIFY_LOGIN_ID)
+            actions.mark_signed_in(self.driver)
             return True
         except Exception as e:
             pass
@@ -137,6 +284,21 @@ class Scraper:
     def scroll_to_bottom(self):
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
+    def scroll_until_stable(self, item_selector, container=None, quiet=1, timeout=None):
+        """Scrolls `container` (CSS, or the window) to the bottom until the
+        number of `item_selector` matches stops growing for `quiet` seconds.
+
+        Returns the final number of items."""
+        timeout = self.SCROLL_TIMEOUT if timeout is None else timeout
+        self.driver.set_script_timeout(timeout + 1)
+        return self.driver.execute_async_script(
+            scripts.SCROLL_UNTIL_STABLE,
+            container,
+            item_selector,
+            int(quiet * 1000),
+            int(timeout * 1000),
+        )
+
     def scroll_class_name_element_to_page_percent(
         self, class_name: str, page_percent: float
     ):
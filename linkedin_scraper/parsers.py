@@ -0,0 +1,637 @@
+from lxml import html
+
+from .dates import split_certification_dates, split_education_times, split_work_times
+from .objects import (
+    Certification,
+    Education,
+    Experience,
+    Language,
+    Skill,
+)
+
+
+def has_class(class_name):
+    return "contains(concat(' ', normalize-space(@class), ' '), ' {} ')".format(
+        class_name
+    )
+
+
+def document(page):
+    """Accepts raw page source or an already parsed lxml element."""
+    if isinstance(page, (str, bytes)):
+        return html.fromstring(page)
+    return page
+
+
+def children(elem):
+    return elem.xpath("*")
+
+
+def first(elem, xpath):
+    found = elem.xpath(xpath)
+    return found[0] if found else None
+
+
+def text_of(elem):
+    """Text of `elem` as the browser renders it, without the screen-reader
+    duplicates LinkedIn nests in `visually-hidden` spans."""
+    if elem is None:
+        return ""
+    parts = elem.xpath(
+        ".//text()[not(ancestor::*[{}])]".format(has_class("visually-hidden"))
+    )
+    lines = (" ".join(part.split()) for part in parts)
+    return "\n".join(line for line in lines if line)
+
+
+def span_text(elem):
+    return text_of(first(elem, ".//span"))
+
+
+def section_items(page):
+    """The `pvs-list__paged-list-item` entries of a `details/*` page."""
+    root = document(page)
+    main_list = first(
+        root, "//main//*[{}]".format(has_class("pvs-list__container"))
+    )
+    if main_list is None:
+        return []
+    return main_list.xpath(".//*[{}]".format(has_class("pvs-list__paged-list-item")))
+
+
+def entity(item):
+    return first(item, ".//div[@data-view-name='profile-component-entity']")
+
+
+def experience_from_row(row):
+    """Builds an Experience from a row of `scripts.EXTRACT_EXPERIENCES`."""
+    from_date, to_date, duration = split_work_times(row["work_times"])
+    return Experience(
+        position_title=row["position_title"],
+        from_date=from_date,
+        to_date=to_date,
+        duration=duration,
+        location=row["location"],
+        description=row["description"],
+        institution_name=row["company"],
+        linkedin_url=row["linkedin_url"],
+    )
+
+
+def education_from_row(row):
+    """Builds an Education from a row of `scripts.EXTRACT_EDUCATIONS`."""
+    from_date, to_date = split_education_times(row["times"])
+    return Education(
+        from_date=from_date,
+        to_date=to_date,
+        description=row["description"],
+        degree=row["degree"],
+        institution_name=row["institution_name"],
+        linkedin_url=row["linkedin_url"],
+    )
+
+
+def certification_from_row(row):
+    """Builds a Certification from a row of `scripts.EXTRACT_CERTIFICATIONS`."""
+    issued_date, expired_date = split_certification_dates(row["date_text"])
+    return Certification(
+        issued_date=issued_date,
+        expired_date=expired_date,
+        skills=row["skills"],
+        cert_name=row["cert_name"],
+        credential_id=row["credential_id"],
+        credential_url=row["credential_url"],
+        institution_name=row["institution_name"],
+        linkedin_url=row["linkedin_url"],
+    )
+
+
+def parse_experiences(page):
+    experiences = []
+    for item in section_items(page):
+        position = entity(item)
+        if position is None:
+            continue
+        elements = children(position)
+        if len(elements) < 2:
+            continue
+        company_logo_elem, position_details = elements[0], elements[1]
+
+        company_link = first(company_logo_elem, "*")
+        company_linkedin_url = (
+            company_link.get("href") if company_link is not None else None
+        )
+        if not company_linkedin_url:
+            continue
+
+        position_details_list = children(position_details)
+        if not position_details_list:
+            continue
+        position_summary_details = position_details_list[0]
+        position_summary_text = (
+            position_details_list[1] if len(position_details_list) > 1 else None
+        )
+
+        summary = first(position_summary_details, "*")
+        outer_positions = children(summary) if summary is not None else []
+
+        if len(outer_positions) == 4:
+            position_title = span_text(outer_positions[0])
+            company = span_text(outer_positions[1])
+            work_times = span_text(outer_positions[2])
+            location = span_text(outer_positions[3])
+        elif len(outer_positions) == 3:
+            if "·" in text_of(outer_positions[2]):
+                position_title = span_text(outer_positions[0])
+                company = span_text(outer_positions[1])
+                work_times = span_text(outer_positions[2])
+                location = ""
+            else:
+                position_title = ""
+                company = span_text(outer_positions[0])
+                work_times = span_text(outer_positions[1])
+                location = span_text(outer_positions[2])
+        else:
+            position_title = ""
+            company = span_text(outer_positions[0]) if outer_positions else ""
+            work_times = span_text(outer_positions[1]) if len(outer_positions) > 1 else ""
+            location = ""
+
+        from_date, to_date, duration = split_work_times(work_times)
+
+        inner_positions = []
+        if position_summary_text is not None and any(
+            child.get("class") == "pvs-list__container"
+            for child in children(position_summary_text)
+        ):
+            inner_list = first(
+                position_summary_text,
+                ".//*[{}]/*/*/*".format(has_class("pvs-list__container")),
+            )
+            if inner_list is not None:
+                inner_positions = inner_list.xpath(
+                    ".//*[{}]".format(has_class("pvs-list__paged-list-item"))
+                )
+
+        if len(inner_positions) > 1:
+            for description in inner_positions:
+                anchor = first(description, ".//a")
+                if anchor is None:
+                    continue
+                res = children(anchor)
+                position_title_elem = res[0] if len(res) > 0 else None
+                work_times_elem = res[1] if len(res) > 1 else None
+                location_elem = res[2] if len(res) > 2 else None
+
+                inner_title = (
+                    first(position_title_elem, "*/*")
+                    if position_title_elem is not None
+                    else None
+                )
+                inner_from, inner_to, inner_duration = split_work_times(
+                    text_of(first(work_times_elem, "*"))
+                    if work_times_elem is not None
+                    else ""
+                )
+                experiences.append(
+                    Experience(
+                        position_title=text_of(inner_title),
+                        from_date=inner_from,
+                        to_date=inner_to,
+                        duration=inner_duration,
+                        location=(
+                            text_of(first(location_elem, "*"))
+                            if location_elem is not None
+                            else None
+                        ),
+                        description=text_of(description),
+                        institution_name=company,
+                        linkedin_url=company_linkedin_url,
+                    )
+                )
+        else:
+            experiences.append(
+                Experience(
+                    position_title=position_title,
+                    from_date=from_date,
+                    to_date=to_date,
+                    duration=duration,
+                    location=location,
+                    description=text_of(position_summary_text),
+                    institution_name=company,
+                    linkedin_url=company_linkedin_url,
+                )
+            )
+    return experiences
+
+
+def parse_certifications(page):
+    certifications = []
+    for item in section_items(page):
+        position = entity(item)
+        if position is None:
+            continue
+        elements = children(position)
+        if len(elements) != 2:
+            continue
+        cert_logo_elem, cert_details = elements
+
+        cert_link = first(cert_logo_elem, "*")
+        cert_linkedin_url = cert_link.get("href") if cert_link is not None else None
+
+        cert_details_list = children(cert_details)
+        first_a_tag = first(cert_details, ".//a")
+        if not cert_details_list or first_a_tag is None:
+            continue
+        credential_url = first_a_tag.get("href")
+        details = cert_details_list[0].xpath("*[1]/*")
+        if not details:
+            continue
+
+        cert_name = span_text(details[0])
+        institution_name = span_text(details[1]) if len(details) > 1 else None
+
+        issued_date, expired_date = split_certification_dates(
+            span_text(details[2]) if len(details) > 2 else None
+        )
+
+        credential_id = span_text(details[3]) if len(details) > 3 else None
+
+        skills_text_clean = None
+        if len(cert_details_list) > 1:
+            skill_element = first(
+                cert_details_list[1],
+                ".//li[{}]".format(has_class("pvs-list__item--with-top-padding")),
+            )
+            if skill_element is not None:
+                skills_text = text_of(first(skill_element, ".//span[@aria-hidden='true']"))
+                skills_text_clean = skills_text.replace("Skills: ", "")
+
+        certifications.append(
+            Certification(
+                issued_date=issued_date,
+                expired_date=expired_date,
+                skills=skills_text_clean,
+                cert_name=cert_name,
+                credential_id=credential_id,
+                credential_url=credential_url,
+                institution_name=institution_name,
+                linkedin_url=cert_linkedin_url,
+            )
+        )
+    return certifications
+
+
+def parse_educations(page):
+    educations = []
+    for item in section_items(page):
+        position = entity(item)
+        if position is None:
+            continue
+        elements = children(position)
+        if len(elements) < 2:
+            continue
+        institution_logo_elem, position_details = elements[0], elements[1]
+
+        institution_link = first(institution_logo_elem, "*")
+        institution_linkedin_url = (
+            institution_link.get("href") if institution_link is not None else None
+        )
+
+        position_details_list = children(position_details)
+        if not position_details_list:
+            continue
+        position_summary_details = position_details_list[0]
+        position_summary_text = (
+            position_details_list[1] if len(position_details_list) > 1 else None
+        )
+
+        outer_positions = position_summary_details.xpath("*[1]/*")
+        institution_name = span_text(outer_positions[0]) if outer_positions else ""
+        degree = span_text(outer_positions[1]) if len(outer_positions) > 1 else None
+
+        from_date, to_date = split_education_times(
+            span_text(outer_positions[2]) if len(outer_positions) > 2 else None
+        )
+
+        educations.append(
+            Education(
+                from_date=from_date,
+                to_date=to_date,
+                description=text_of(position_summary_text),
+                degree=degree,
+                institution_name=institution_name,
+                linkedin_url=institution_linkedin_url,
+            )
+        )
+    return educations
+
+
+def _is_empty_section(items):
+    return bool(
+        items
+        and items[0].xpath(
+            ".//section[contains(@class, 'artdeco-empty-state')]"
+        )
+    )
+
+
+def _named_entities(page):
+    items = section_items(page)
+    if _is_empty_section(items):
+        return
+    for item in items:
+        if item.xpath(".//*[{}]".format(has_class("artdeco-empty-state__headline"))):
+            continue
+        position = entity(item)
+        if position is None:
+            continue
+        elements = children(position)
+        if len(elements) != 2:
+            continue
+        yield elements[1]
+
+
+def parse_skills(page):
+    return [Skill(name=span_text(element)) for element in _named_entities(page)]
+
+
+def parse_languages(page):
+    languages = []
+    for element in _named_entities(page):
+        proficiency_element = first(
+            element, ".//*[{}]".format(has_class("pvs-entity__caption-wrapper"))
+        )
+        languages.append(
+            Language(
+                language=span_text(element),
+                proficiency=(
+                    text_of(proficiency_element)
+                    if proficiency_element is not None
+                    else None
+                ),
+            )
+        )
+    return languages
+
+
+def parse_person_main(page):
+    root = document(page)
+    top_panel = first(root, "//*[@class='mt2 relative']")
+    location = first(
+        root, "//*[@class='text-body-small inline t-black--light break-words']"
+    )
+    about = first(root, "//*[@id='about']/..//*[{}]".format(has_class("display-flex")))
+    picture = first(
+        root, "//*[{}]//img".format(has_class("pv-top-card-profile-picture"))
+    )
+    return {
+        "name": text_of(first(top_panel, ".//h1")) if top_panel is not None else None,
+        "location": text_of(location) if location is not None else None,
+        "about": text_of(about) if about is not None else None,
+        "open_to_work": picture is not None
+        and "#OPEN_TO_WORK" in (picture.get("title") or ""),
+    }
+
+
+COMPANY_ABOUT_LABELS = {
+    "Website": "website",
+    "Phone": "phone",
+    "Industry": "industry",
+    "Company size": "company_size",
+    "Headquarters": "headquarters",
+    "Type": "company_type",
+    "Founded": "founded",
+    "Specialties": "specialties",
+}
+
+
+def company_about_fields(labels, values):
+    """Pairs the `dt`/`dd` texts of a company about grid into attributes.
+
+    The company size `dd` is sometimes followed by an unlabelled "associated
+    members" `dd`, which shifts every later value by one."""
+    fields = {}
+    x_off = 0
+    for i in range(min(len(labels), len(values))):
+        attribute = COMPANY_ABOUT_LABELS.get(labels[i].strip())
+        if attribute is None or i + x_off >= len(values):
+            continue
+        value = values[i + x_off].strip()
+        if attribute == "specialties":
+            value = "\n".join(value.split(", "))
+        fields[attribute] = value
+        if attribute == "company_size" and len(values) > len(labels):
+            x_off = 1
+    return fields
+
+
+def _company_cards(company_list):
+    cards = []
+    for card in company_list.xpath(".//*[{}]".format(has_class("org-company-card"))):
+        link = first(card, ".//*[{}]".format(has_class("company-name-link")))
+        followers = first(card, ".//*[{}]".format(has_class("company-followers-count")))
+        if link is None:
+            continue
+        cards.append(
+            {
+                "linkedin_url": link.get("href"),
+                "name": text_of(link),
+                "followers": text_of(followers) if followers is not None else None,
+            }
+        )
+    return cards
+
+
+def parse_company_page(page):
+    """Fields of a company home or `/about` page; absent fields are omitted."""
+    root = document(page)
+    fields = {}
+
+    title = first(root, "//*[{}]".format(has_class("org-top-card-summary__title")))
+    if title is not None:
+        fields["name"] = text_of(title)
+
+    grid = first(
+        root,
+        "//*[{}]".format(
+            " and ".join(
+                has_class(name)
+                for name in (
+                    "artdeco-card",
+                    "org-page-details-module__card-spacing",
+                    "org-about-module__margin-bottom",
+                )
+            )
+        ),
+    )
+    if grid is not None:
+        description = first(grid, ".//p")
+        if description is not None:
+            fields["about_us"] = text_of(description)
+        fields.update(
+            company_about_fields(
+                [text_of(label) for label in grid.xpath(".//dt")],
+                [text_of(value) for value in grid.xpath(".//dd")],
+            )
+        )
+
+    headcount = first(root, "//*[{}]".format(has_class("mt1")))
+    if headcount is not None:
+        for span in headcount.xpath(".//span"):
+            txt = text_of(span)
+            if "See all" in txt and "employees on LinkedIn" in txt:
+                fields["headcount"] = int(
+                    txt.replace("See all", "")
+                    .replace("employees on LinkedIn", "")
+                    .replace(",", "")
+                    .strip()
+                )
+
+    fields.update(parse_related_companies(root))
+    return fields
+
+
+def parse_related_companies(page):
+    """The showcase pages and affiliated companies listed on a company page,
+    as {"showcase_pages": [...], "affiliated_companies": [...]} of card dicts,
+    or {} if the page does not have both lists."""
+    company_lists = document(page).xpath("//*[{}]".format(has_class("company-list")))
+    if len(company_lists) != 2:
+        return {}
+    showcase, affiliated = company_lists
+    return {
+        "showcase_pages": _company_cards(showcase),
+        "affiliated_companies": _company_cards(affiliated),
+    }
+
+
+def _by_class(root, class_name):
+    return first(root, "//*[{}]".format(has_class(class_name)))
+
+
+def _text_under_subtitle(elem):
+    return "\n".join(text_of(elem).split("\n")[1:]) if elem is not None else None
+
+
+def parse_public_company_page(page):
+    """Fields of the company page shown to visitors who are not logged in,
+    which is static markup; absent fields are omitted."""
+    root = document(page)
+    fields = {}
+    for attribute, class_name in (
+        ("name", "name"),
+        ("about_us", "basic-info-description"),
+        ("headquarters", "adr"),
+        ("industry", "industry"),
+        ("company_size", "company-size"),
+    ):
+        elem = _by_class(root, class_name)
+        if elem is not None:
+            fields[attribute] = text_of(elem)
+    for attribute, class_name in (
+        ("specialties", "specialties"),
+        ("website", "website"),
+        ("phone", "phone"),
+        ("company_type", "type"),
+        ("founded", "founded"),
+    ):
+        elem = _by_class(root, class_name)
+        if elem is not None:
+            fields[attribute] = _text_under_subtitle(elem)
+
+    showcase_pages = []
+    seen = set()
+    for card in root.xpath("//*[{}]//li".format(has_class("company-showcase-pages"))):
+        name = first(card, ".//*[{}]".format(has_class("name")))
+        link = first(name, ".//a") if name is not None else None
+        if link is None or link.get("href") in seen:
+            continue
+        seen.add(link.get("href"))
+        lines = text_of(card).split("\n")
+        showcase_pages.append(
+            {
+                "linkedin_url": link.get("href"),
+                "name": text_of(name),
+                "followers": lines[1] if len(lines) > 1 else None,
+            }
+        )
+    if showcase_pages:
+        fields["showcase_pages"] = showcase_pages
+
+    affiliated = root.xpath(
+        "//*[{}]//*[{}]".format(
+            has_class("affiliated-companies"), has_class("affiliated-company-name")
+        )
+    )
+    if affiliated:
+        fields["affiliated_companies"] = [
+            {"linkedin_url": first(elem, ".//a").get("href"), "name": text_of(elem)}
+            for elem in affiliated
+            if first(elem, ".//a") is not None
+        ]
+    return fields
+
+
+def employee_from_text(text, linkedin_url):
+    lines = text.split("\n")
+    return {
+        "name": lines[0].strip(),
+        "designation": lines[3].strip(),
+        "linkedin_url": linkedin_url,
+    }
+
+
+def parse_employees(page):
+    root = document(page)
+    results_list = first(root, "//*[{}]".format(has_class("list-style-none")))
+    if results_list is None:
+        return []
+    employees = []
+    for employee in results_list.xpath(".//li"):
+        anchor = first(employee, ".//a")
+        try:
+            employees.append(employee_from_text(text_of(employee), anchor.get("href")))
+        except (AttributeError, IndexError):
+            continue
+    return employees
+
+
+def parse_job(page):
+    root = document(page)
+
+    def by_class(name):
+        return first(root, "//*[{}]".format(has_class(name)))
+
+    fields = {}
+    title = by_class("job-details-jobs-unified-top-card__job-title")
+    if title is not None:
+        fields["job_title"] = text_of(title)
+
+    company = by_class("job-details-jobs-unified-top-card__company-name")
+    if company is not None:
+        fields["company"] = text_of(company)
+        link = first(company, ".//a")
+        fields["company_linkedin_url"] = link.get("href") if link is not None else None
+
+    primary = by_class("job-details-jobs-unified-top-card__primary-description-container")
+    if primary is not None:
+        texts = [text_of(span) for span in primary.xpath(".//span")]
+        texts = [text for text in texts if text.strip() != ""]
+        if len(texts) > 0:
+            fields["location"] = texts[0]
+        if len(texts) > 3:
+            fields["posted_date"] = texts[3]
+
+    applicant_count = by_class("jobs-unified-top-card__applicant-count")
+    fields["applicant_count"] = (
+        text_of(applicant_count) if applicant_count is not None else 0
+    )
+
+    description = by_class("jobs-description")
+    if description is not None:
+        fields["job_description"] = text_of(description)
+
+    benefits = by_class("jobs-unified-description__salary-main-rail-card")
+    fields["benefits"] = text_of(benefits) if benefits is not None else None
+    return fields
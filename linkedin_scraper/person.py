@@ -1,14 +1,13 @@
 import os
 
 import requests
-from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from dataclasses import asdict
 
 
+from . import actions, browser, dates, parsers, ratelimit, serializers
 from .objects import (
     Accomplishment,
     Contact,
@@ -47,8 +46,18 @@ class Person(Scraper):
         scrape=True,
         close_on_complete=True,
         time_to_wait_after_login=0,
+        snapshot=False,
+        parallel_sections=False,
+        sections=None,
+        lazy=False,
     ):
         self.linkedin_url = linkedin_url
+        self.sections = set(self.SECTIONS if sections is None else sections)
+        unknown = self.sections.difference(self.SECTIONS)
+        if unknown:
+            raise ValueError("Unknown sections: {}".format(", ".join(sorted(unknown))))
+        self.snapshot = snapshot
+        self.parallel_sections = parallel_sections
         self.name = name
         self.about = about or []
         self.experiences = experiences or []
@@ -61,7 +70,15 @@ class Person(Scraper):
         self.also_viewed_urls = []
         self.contacts = contacts or []
 
-        if driver is None:
+        # sections left out of `sections` are fetched on first attribute access
+        self._pending_sections = set()
+        if lazy:
+            for section, attribute in self.SECTION_ATTRIBUTES.items():
+                if section not in self.sections and not getattr(self, attribute):
+                    self._pending_sections.add(section)
+                    delattr(self, attribute)
+
+        if driver is None and (get or scrape):
             try:
                 if os.getenv("CHROMEDRIVER") == None:
                     driver_path = os.path.join(
@@ -70,18 +87,104 @@ class Person(Scraper):
                 else:
                     driver_path = os.getenv("CHROMEDRIVER")
 
-                driver = webdriver.Chrome(driver_path)
+                driver = browser.lean_chrome(driver_path)
             except:
-                driver = webdriver.Chrome()
+                driver = browser.lean_chrome()
 
-        if get:
-            driver.get(linkedin_url)
+        # the profile page itself is only needed for the "main" section, or to
+        # find out whether the driver is signed in
+        if get and not (
+            scrape and "main" not in self.sections and actions.known_signed_in(driver)
+        ):
+            ratelimit.navigate(driver, linkedin_url)
 
         self.driver = driver
 
         if scrape:
             self.scrape(close_on_complete)
 
+    SECTIONS = (
+        "main",
+        "experience",
+        "certifications",
+        "education",
+        "skills",
+        "languages",
+    )
+
+    SECTION_ATTRIBUTES = {
+        "experience": "experiences",
+        "certifications": "certifications",
+        "education": "educations",
+        "skills": "skills",
+        "languages": "languages",
+    }
+
+    SECTION_PARSERS = {
+        "experience": (parsers.parse_experiences, "add_experience"),
+        "certifications": (parsers.parse_certifications, "add_certification"),
+        "education": (parsers.parse_educations, "add_education"),
+        "skills": (parsers.parse_skills, "add_skill"),
+        "languages": (parsers.parse_languages, "add_language"),
+    }
+
+    SECTION_GETTERS = {
+        "experience": "get_experiences",
+        "certifications": "get_certifications",
+        "education": "get_educations",
+        "skills": "get_skills",
+        "languages": "get_languages",
+    }
+
+    @classmethod
+    async def fetch(cls, linkedin_url, session, **kwargs):
+        """Scrapes a profile from a coroutine on a driver of `session` (an
+        aio.AsyncSession); `kwargs` are passed on to Person."""
+        return await session.run(
+            lambda driver: cls(
+                linkedin_url, driver=driver, close_on_complete=False, **kwargs
+            )
+        )
+
+    @classmethod
+    def from_html(cls, pages, linkedin_url=None):
+        """Builds a Person from saved page sources, without a browser.
+
+        `pages` maps "main" (the profile page) and any of the `details/*`
+        section names in `SECTION_PARSERS` to their HTML."""
+        person = cls(linkedin_url=linkedin_url, get=False, scrape=False)
+        if "main" in pages:
+            for attribute, value in parsers.parse_person_main(pages["main"]).items():
+                setattr(person, attribute, value)
+        for section, (parse, add) in cls.SECTION_PARSERS.items():
+            if section in pages:
+                for record in parse(pages[section]):
+                    getattr(person, add)(record)
+        return person
+
+    def __getattr__(self, name):
+        pending = self.__dict__.get("_pending_sections", ())
+        for section in pending:
+            if self.SECTION_ATTRIBUTES[section] == name:
+                pending.discard(section)
+                setattr(self, name, [])
+                try:
+                    getattr(self, self.SECTION_GETTERS[section])()
+                except Exception as e:
+                    # leave the section pending, and keep the failure from
+                    # passing for a missing attribute in hasattr/getattr
+                    delattr(self, name)
+                    pending.add(section)
+                    raise RuntimeError(
+                        "could not load the {} section of {}".format(
+                            section, self.linkedin_url
+                        )
+                    ) from e
+                return self.__dict__[name]
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
     def add_about(self, about):
         self.about.append(about)
 
@@ -128,6 +231,42 @@ class Person(Scraper):
         except Exception as e:
             pass
 
+    def _open_section(self, section):
+        self.navigate(os.path.join(self.linkedin_url, "details", section))
+        return self._wait_for_section_list()
+
+    def _wait_for_section_list(self):
+        self.wait_until_ready("main .pvs-list__container")
+        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
+        self.scroll_until_stable("main .pvs-list__paged-list-item", quiet=0.5)
+        return self.wait_for_element_to_load(name="pvs-list__container", base=main)
+
+    def get_sections_in_tabs(self, sections):
+        """Loads the `details/*` pages of `sections` concurrently, one tab each,
+        then extracts them in turn while the remaining tabs finish loading."""
+        driver = self.driver
+        origin = driver.current_window_handle
+        tabs = {}
+        try:
+            for section in sections:
+                url = os.path.join(self.linkedin_url, "details", section)
+                ratelimit.pace(url)
+                before = set(driver.window_handles)
+                driver.execute_script("window.open(arguments[0], '_blank');", url)
+                tabs[section] = ((set(driver.window_handles) - before).pop(), url)
+
+            for section, (handle, url) in tabs.items():
+                driver.switch_to.window(handle)
+                ratelimit.report(url, driver.current_url)
+                getattr(self, self.SECTION_GETTERS[section])(
+                    main_list=self._wait_for_section_list()
+                )
+        finally:
+            for handle, _ in tabs.values():
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(origin)
+
     def is_open_to_work(self):
         try:
             return "#OPEN_TO_WORK" in self.driver.find_element(
@@ -136,14 +275,18 @@ class Person(Scraper):
         except:
             return False
 
-    def get_experiences(self):
-        url = os.path.join(self.linkedin_url, "details/experience")
-        self.driver.get(url)
-        self.focus()
-        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-        self.scroll_to_half()
-        self.scroll_to_bottom()
-        main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+    def get_experiences(self, main_list=None):
+        if main_list is None:
+            main_list = self._open_section("experience")
+        if self.snapshot:
+            for experience in parsers.parse_experiences(self.page_snapshot()):
+                self.add_experience(experience)
+            return
+        rows = self.run_extractor("experiences")
+        if rows is not None:
+            for row in rows:
+                self.add_experience(parsers.experience_from_row(row))
+            return
         for position in main_list.find_elements(
             By.CLASS_NAME, "pvs-list__paged-list-item"
         ):
@@ -223,21 +366,7 @@ class Person(Scraper):
                 )
                 location = ""
 
-            # Safely extract times and duration
-            if work_times:
-                parts = work_times.split("·")
-                times = parts[0].strip() if parts else ""
-                duration = parts[1].strip() if len(parts) > 1 else None
-            else:
-                times = ""
-                duration = None
-
-            from_date = " ".join(times.split(" ")[:2]) if times else ""
-            to_date = (
-                " ".join(times.split(" ")[3:])
-                if times and len(times.split(" ")) > 3
-                else ""
-            )
+            from_date, to_date, duration = dates.split_work_times(work_times)
 
             if position_summary_text and any(
                 element.get_attribute("class") == "pvs-list__container"
@@ -287,21 +416,7 @@ class Person(Scraper):
                             else ""
                         )
 
-                        # Safely extract times and duration
-                        if work_times:
-                            parts = work_times.split("·")
-                            times = parts[0].strip() if parts else ""
-                            duration = parts[1].strip() if len(parts) > 1 else None
-                        else:
-                            times = ""
-                            duration = None
-
-                        from_date = " ".join(times.split(" ")[:2]) if times else ""
-                        to_date = (
-                            " ".join(times.split(" ")[3:])
-                            if times and len(times.split(" ")) > 3
-                            else ""
-                        )
+                        from_date, to_date, duration = dates.split_work_times(work_times)
 
                         experience = Experience(
                             position_title=position_title,
@@ -334,14 +449,18 @@ class Person(Scraper):
                 )
                 self.add_experience(experience)
 
-    def get_certifications(self):
-        url = os.path.join(self.linkedin_url, "details/certifications")
-        self.driver.get(url)
-        self.focus()
-        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-        self.scroll_to_half()
-        self.scroll_to_bottom()
-        main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+    def get_certifications(self, main_list=None):
+        if main_list is None:
+            main_list = self._open_section("certifications")
+        if self.snapshot:
+            for certification in parsers.parse_certifications(self.page_snapshot()):
+                self.add_certification(certification)
+            return
+        rows = self.run_extractor("certifications")
+        if rows is not None:
+            for row in rows:
+                self.add_certification(parsers.certification_from_row(row))
+            return
         for position in main_list.find_elements(
             By.CLASS_NAME, "pvs-list__paged-list-item"
         ):
@@ -373,23 +492,11 @@ class Person(Scraper):
                 else:
                     institution_name = None
 
-                if len(details) > 2:
-                    date_text = details[2].find_element(By.TAG_NAME, "span").text
-                    issued_date = ""
-                    expired_date = ""
-                    for part in date_text.split("·"):
-                        part = part.strip()
-                        if part.startswith("Issued"):
-                            issued_date = part.replace("Issued", "").strip()
-                        elif part.startswith("Expires") or part.startswith("Expired"):
-                            expired_date = (
-                                part.replace("Expires", "")
-                                .replace("Expired", "")
-                                .strip()
-                            )
-                else:
-                    issued_date = None
-                    expired_date = None
+                issued_date, expired_date = dates.split_certification_dates(
+                    details[2].find_element(By.TAG_NAME, "span").text
+                    if len(details) > 2
+                    else None
+                )
 
                 if len(details) > 3:
                     credential_id = details[3].find_element(By.TAG_NAME, "span").text
@@ -429,14 +536,18 @@ class Person(Scraper):
                 print(f"Error processing certification: {e}")
                 continue
 
-    def get_educations(self):
-        url = os.path.join(self.linkedin_url, "details/education")
-        self.driver.get(url)
-        self.focus()
-        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-        self.scroll_to_half()
-        self.scroll_to_bottom()
-        main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+    def get_educations(self, main_list=None):
+        if main_list is None:
+            main_list = self._open_section("education")
+        if self.snapshot:
+            for education in parsers.parse_educations(self.page_snapshot()):
+                self.add_education(education)
+            return
+        rows = self.run_extractor("educations")
+        if rows is not None:
+            for row in rows:
+                self.add_education(parsers.education_from_row(row))
+            return
         for position in main_list.find_elements(
             By.CLASS_NAME, "pvs-list__paged-list-item"
         ):
@@ -493,23 +604,11 @@ class Person(Scraper):
 
                 if len(outer_positions) > 2:
                     try:
-                        times = (
+                        from_date, to_date = dates.split_education_times(
                             outer_positions[2].find_element(By.TAG_NAME, "span").text
                         )
-
-                        if times and "-" in times:
-                            split_times = times.split(" ")
-                            dash_index = (
-                                split_times.index("-") if "-" in split_times else -1
-                            )
-
-                            if dash_index > 0:
-                                from_date = split_times[dash_index - 1]
-                            if dash_index < len(split_times) - 1:
-                                to_date = split_times[-1]
-                    except (NoSuchElementException, ValueError):
-                        from_date = None
-                        to_date = None
+                    except NoSuchElementException:
+                        pass
 
                 description = (
                     position_summary_text.text if position_summary_text else ""
@@ -549,7 +648,7 @@ class Person(Scraper):
 
     def get_connections(self):
         try:
-            self.driver.get(
+            self.navigate(
                 "https://www.linkedin.com/mynetwork/invite-connect/connections/"
             )
             _ = WebDriverWait(self.driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
@@ -607,15 +706,13 @@ class Person(Scraper):
         except:
             pass
 
-    def get_skills(self):
-        url = os.path.join(self.linkedin_url, "details/skills")
-
-        self.driver.get(url)
-        self.focus()
-        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-        self.scroll_to_half()
-        self.scroll_to_bottom()
-        main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+    def get_skills(self, main_list=None):
+        if main_list is None:
+            main_list = self._open_section("skills")
+        if self.snapshot:
+            for skill in parsers.parse_skills(self.page_snapshot()):
+                self.add_skill(skill)
+            return
         positions = main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
         empty_sections = positions[0].find_elements(
             By.XPATH, ".//section[contains(@class, 'artdeco-empty-state')]"
@@ -638,20 +735,18 @@ class Person(Scraper):
                         _, skill_element = item.find_elements(By.XPATH, "*")
                         name = skill_element.find_element(By.CSS_SELECTOR, "span").text
                         skill = Skill(name=name)
-                        self.add_skills(skill)
+                        self.add_skill(skill)
                 except (NoSuchElementException, IndexError) as e:
                     print(f"Error processing certification: {e}")
                     continue
 
-    def get_languages(self):
-        url = os.path.join(self.linkedin_url, "details/languages")
-
-        self.driver.get(url)
-        self.focus()
-        main = self.wait_for_element_to_load(by=By.TAG_NAME, name="main")
-        self.scroll_to_half()
-        self.scroll_to_bottom()
-        main_list = self.wait_for_element_to_load(name="pvs-list__container", base=main)
+    def get_languages(self, main_list=None):
+        if main_list is None:
+            main_list = self._open_section("languages")
+        if self.snapshot:
+            for language in parsers.parse_languages(self.page_snapshot()):
+                self.add_language(language)
+            return
         positions = main_list.find_elements(By.CLASS_NAME, "pvs-list__paged-list-item")
         empty_sections = positions[0].find_elements(
             By.XPATH, ".//section[contains(@class, 'artdeco-empty-state')]"
@@ -714,43 +809,39 @@ class Person(Scraper):
         driver = self.driver
         duration = None
 
-        root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
-            EC.presence_of_element_located(
-                (
-                    By.TAG_NAME,
-                    self.__TOP_CARD,
+        if "main" in self.sections:
+            root = WebDriverWait(driver, self.__WAIT_FOR_ELEMENT_TIMEOUT).until(
+                EC.presence_of_element_located(
+                    (
+                        By.TAG_NAME,
+                        self.__TOP_CARD,
+                    )
                 )
             )
-        )
-        self.focus()
-        self.wait(5)
-
-        # get name and location
-        self.get_name_and_location()
-
-        self.open_to_work = self.is_open_to_work()
-
-        # get about
-        self.get_about()
-        driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
-        )
-        driver.execute_script(
-            "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
-        )
-
-        # get experience
-        self.get_experiences()
+            self.wait_until_ready(self.__TOP_CARD)
 
-        # get certification
-        self.get_certifications()
+            # get name and location
+            self.get_name_and_location()
 
-        # get education
-        self.get_educations()
+            self.open_to_work = self.is_open_to_work()
 
-        self.get_skills()
+            # get about
+            self.get_about()
+            driver.execute_script(
+                "window.scrollTo(0, Math.ceil(document.body.scrollHeight/2));"
+            )
+            driver.execute_script(
+                "window.scrollTo(0, Math.ceil(document.body.scrollHeight/1.5));"
+            )
 
-        self.get_languages()
+        sections = [
+            section for section in self.SECTION_GETTERS if section in self.sections
+        ]
+        if self.parallel_sections:
+            self.get_sections_in_tabs(sections)
+        else:
+            for section in sections:
+                getattr(self, self.SECTION_GETTERS[section])()
 
         # driver.get(self.linkedin_url)
 
@@ -763,7 +854,8 @@ class Person(Scraper):
         # # get connections
         # self.get_connections()
 
-        if close_on_complete:
+        # lazy sections still need the driver
+        if close_on_complete and not self._pending_sections:
             driver.quit()
 
     @property
@@ -790,33 +882,7 @@ class Person(Scraper):
 
     @property
     def to_dict(self):
-        return {
-            "name": getattr(self, "name", ""),
-            "headline": getattr(self, "headline", ""),
-            "about": getattr(self, "about", []),
-            "experiences": (
-                [asdict(exp) for exp in self.experiences] if self.experiences else []
-            ),
-            "certifications": (
-                [asdict(cert) for cert in self.certifications]
-                if self.certifications
-                else []
-            ),
-            "educations": (
-                [asdict(edu) for edu in self.educations] if self.educations else []
-            ),
-            "interests": (
-                [asdict(int) for int in self.interests] if self.interests else []
-            ),
-            "accomplishments": (
-                [asdict(acc) for acc in self.accomplishments]
-                if self.accomplishments
-                else []
-            ),
-            "contacts": (
-                [asdict(contact) for contact in self.contacts] if self.contacts else []
-            ),
-        }
+        return serializers.to_dict(self)
 
     def __repr__(self):
         return "<Person {name}\n\nAbout\n{about}\n\nExperience\n{exp}\n\nEducation\n{edu}\n\nCertification\n{cert}\n\nInterest\n{int}\n\Skills\n{skill}\n\nLanguages\n{lang}\n\nContacts\n{conn}>".format(
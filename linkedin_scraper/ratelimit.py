@@ -0,0 +1,167 @@
+import json
+import os
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows: limiters can only be shared within a process
+    fcntl = None
+
+from . import actions
+
+# `rate` navigations per second on average, with up to `burst` at once.
+Budget = namedtuple("Budget", ["rate", "burst"])
+
+DEFAULT_BUDGETS = {
+    "profile": Budget(rate=1 / 6, burst=3),
+    "company": Budget(rate=1 / 4, burst=3),
+    "job": Budget(rate=1 / 3, burst=5),
+    "job_search": Budget(rate=1 / 5, burst=2),
+}
+DEFAULT_BUDGET = Budget(rate=1 / 3, burst=3)
+
+
+def page_type(url):
+    """The budget a LinkedIn URL is paced under."""
+    path = urlsplit(url or "").path
+    if path.startswith("/in/"):
+        return "profile"
+    if path.startswith(("/company/", "/showcase/", "/school/")):
+        return "company"
+    if path.startswith("/jobs/search"):
+        return "job_search"
+    if path.startswith("/jobs/"):
+        return "job"
+    return "other"
+
+
+class RateLimiter:
+    """Token buckets, one per page type, that every navigation draws from.
+
+    With `path`, the buckets live in that file (locked with `fcntl`), so
+    every thread and process pointing at it shares one budget; without it
+    they are shared by the threads of this process only.
+
+    When a page lands on a login or checkpoint URL all navigation pauses for
+    `backoff` seconds, doubling with each further hit up to `max_backoff`, and
+    the pause resets after the next page that loads normally."""
+
+    def __init__(self, budgets=DEFAULT_BUDGETS, default=DEFAULT_BUDGET, path=None, backoff=60, max_backoff=3600):
+        if path is not None and fcntl is None:
+            raise RuntimeError("sharing a RateLimiter through a file needs fcntl")
+        self.budgets = dict(budgets)
+        self.default = default
+        self.path = os.path.expanduser(path) if path is not None else None
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._memory = {}
+
+    def budget(self, page_type):
+        return self.budgets.get(page_type, self.default)
+
+    @contextmanager
+    def _state(self):
+        with self._lock:
+            if self.path is None:
+                yield self._memory
+                return
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    try:
+                        state = json.loads(f.read() or "{}")
+                    except ValueError:
+                        state = {}
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _take(self, page_type, now):
+        """Takes a token for `page_type` if one is available; returns how long
+        to wait before trying again (0 when the token was taken)."""
+        budget = self.budget(page_type)
+        with self._state() as state:
+            paused_until = state.get("paused_until", 0)
+            if now < paused_until:
+                return paused_until - now
+            buckets = state.setdefault("buckets", {})
+            tokens, updated = buckets.get(page_type, (budget.burst, now))
+            tokens = min(budget.burst, tokens + (now - updated) * budget.rate)
+            if tokens >= 1:
+                buckets[page_type] = (tokens - 1, now)
+                return 0
+            buckets[page_type] = (tokens, now)
+            return (1 - tokens) / budget.rate
+
+    def acquire(self, page_type):
+        """Blocks until a navigation to a page of `page_type` is allowed."""
+        while True:
+            wait = self._take(page_type, time.time())
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def report(self, requested_url, landed_url):
+        """Backs off if asking for `requested_url` landed on a login or
+        checkpoint page, and recovers when a page loads normally."""
+        blocked = actions.is_login_url(landed_url) and not actions.is_login_url(requested_url)
+        now = time.time()
+        with self._state() as state:
+            strikes = state.get("strikes", 0)
+            if blocked:
+                state["strikes"] = strikes + 1
+                state["paused_until"] = now + min(self.max_backoff, self.backoff * 2 ** strikes)
+            elif strikes:
+                state["strikes"] = 0
+
+
+_limiter = None
+
+
+def install(limiter):
+    """Makes `limiter` pace every navigation of the scrapers; None turns
+    pacing off."""
+    global _limiter
+    _limiter = limiter
+
+
+def installed():
+    return _limiter
+
+
+def pace(url):
+    """Waits until the installed limiter allows loading `url`, for loads that
+    do not go through `navigate` (e.g. opening it in a new tab)."""
+    if _limiter is not None:
+        _limiter.acquire(page_type(url))
+
+
+def report(requested_url, landed_url):
+    """Tells the installed limiter where a load that did not go through
+    `navigate` landed, so it can back off."""
+    if _limiter is not None:
+        _limiter.report(requested_url, landed_url)
+
+
+def navigate(driver, url, probe=False):
+    """`driver.get(url)`, paced by the installed limiter. A `probe` load is
+    one that asks whether the driver is signed in, where landing on a login
+    page is an answer rather than a block, so it is not reported."""
+    limiter = _limiter
+    if limiter is None:
+        driver.get(url)
+        return
+    limiter.acquire(page_type(url))
+    driver.get(url)
+    if not probe:
+        limiter.report(url, driver.current_url)
@@ -0,0 +1,274 @@
+# JavaScript run inside the page through `execute_script`/`execute_async_script`.
+
+# arguments: css selector (or null), quiet period in ms, timeout in ms.
+# Resolves true once the document has loaded, the selector matches and no
+# DOM mutation happened for the quiet period; false when the timeout expires.
+WAIT_UNTIL_READY = """
+var selector = arguments[0], quiet = arguments[1], timeout = arguments[2];
+var done = arguments[arguments.length - 1];
+var start = Date.now(), last = Date.now();
+var observer = new MutationObserver(function () { last = Date.now(); });
+observer.observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+var timer = setInterval(function () {
+    var now = Date.now();
+    var present = !selector || document.querySelector(selector) !== null;
+    if (present && document.readyState === 'complete' && now - last >= quiet) {
+        finish(true);
+    } else if (now - start >= timeout) {
+        finish(false);
+    }
+}, 50);
+function finish(ready) {
+    observer.disconnect();
+    clearInterval(timer);
+    done(ready);
+}
+"""
+
+# arguments: css selector of the scroll container (or null for the window),
+# css selector of the items, quiet period in ms, timeout in ms.
+# Keeps scrolling to the bottom until the number of items has not grown for
+# the quiet period, then resolves with that number.
+SCROLL_UNTIL_STABLE = """
+var container = arguments[0] ? document.querySelector(arguments[0]) : null;
+var itemSelector = arguments[1], quiet = arguments[2], timeout = arguments[3];
+var done = arguments[arguments.length - 1];
+var root = container || document;
+function count() { return root.querySelectorAll(itemSelector).length; }
+function scroll() {
+    if (container) {
+        container.scrollTo(0, container.scrollHeight);
+    } else {
+        window.scrollTo(0, document.body.scrollHeight);
+    }
+}
+var start = Date.now(), last = Date.now(), seen = count();
+scroll();
+var timer = setInterval(function () {
+    var now = Date.now(), current = count();
+    if (current !== seen) {
+        seen = current;
+        last = now;
+    } else if (now - last >= quiet || now - start >= timeout) {
+        clearInterval(timer);
+        done(seen);
+        return;
+    }
+    scroll();
+}, 100);
+"""
+
+# arguments: {key: class name}.
+# returns {key: whether an element with that class is in the page}, so the
+# presence of several elements costs one round-trip.
+PROBE_CLASSES = """
+var names = arguments[0], found = {};
+Object.keys(names).forEach(function (key) {
+    found[key] = document.getElementsByClassName(names[key]).length > 0;
+});
+return found;
+"""
+
+# returns the bytes transferred for the document and every resource it
+# loaded since the last navigation.
+TRANSFERRED_BYTES = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+return entries.reduce(function (total, entry) { return total + (entry.transferSize || 0); }, 0);
+"""
+
+# Extraction scripts: each walks one list in the page and returns plain
+# fields as JSON, so a whole section costs a single WebDriver call.
+EXTRACT_PRELUDE = """
+function kids(el) { return el ? Array.prototype.slice.call(el.children) : []; }
+function text(el) { return el ? (el.innerText || '').trim() : ''; }
+function spanText(el) { return el ? text(el.querySelector('span')) : ''; }
+function href(el) { return el ? el.href || el.getAttribute('href') : null; }
+function sectionItems() {
+    var list = document.querySelector('main .pvs-list__container');
+    return list ? Array.prototype.slice.call(list.querySelectorAll('.pvs-list__paged-list-item')) : [];
+}
+function entity(item) {
+    return item.querySelector("div[data-view-name='profile-component-entity']");
+}
+"""
+
+# returns [{linkedin_url, company, position_title, work_times, location, description}]
+EXTRACT_EXPERIENCES = EXTRACT_PRELUDE + """
+var rows = [];
+sectionItems().forEach(function (item) {
+    var position = entity(item);
+    var elements = kids(position);
+    if (elements.length < 2) { return; }
+    var url = href(elements[0].firstElementChild);
+    if (!url) { return; }
+    var details = kids(elements[1]);
+    if (!details.length) { return; }
+    var summaryText = details[1] || null;
+    var outer = kids(details[0].firstElementChild);
+    var row = {linkedin_url: url, position_title: '', company: '', work_times: '', location: ''};
+    if (outer.length === 4) {
+        row.position_title = spanText(outer[0]);
+        row.company = spanText(outer[1]);
+        row.work_times = spanText(outer[2]);
+        row.location = spanText(outer[3]);
+    } else if (outer.length === 3) {
+        if (text(outer[2]).indexOf('·') !== -1) {
+            row.position_title = spanText(outer[0]);
+            row.company = spanText(outer[1]);
+            row.work_times = spanText(outer[2]);
+        } else {
+            row.company = spanText(outer[0]);
+            row.work_times = spanText(outer[1]);
+            row.location = spanText(outer[2]);
+        }
+    } else {
+        row.company = spanText(outer[0]);
+        row.work_times = spanText(outer[1]);
+    }
+
+    var inner = [];
+    var nested = kids(summaryText).some(function (child) {
+        return child.getAttribute('class') === 'pvs-list__container';
+    });
+    if (nested) {
+        var innerList = summaryText.querySelector('.pvs-list__container');
+        for (var depth = 0; depth < 3 && innerList; depth++) {
+            innerList = innerList.firstElementChild;
+        }
+        if (innerList) {
+            inner = Array.prototype.slice.call(innerList.querySelectorAll('.pvs-list__paged-list-item'));
+        }
+    }
+    if (inner.length > 1) {
+        inner.forEach(function (description) {
+            var res = kids(description.querySelector('a'));
+            if (!res.length) { return; }
+            var title = res[0].firstElementChild;
+            rows.push({
+                linkedin_url: url,
+                company: row.company,
+                position_title: title ? text(title.firstElementChild) : '',
+                work_times: res[1] ? text(res[1].firstElementChild) : '',
+                location: res[2] ? text(res[2].firstElementChild) : null,
+                description: text(description)
+            });
+        });
+    } else {
+        row.description = text(summaryText);
+        rows.push(row);
+    }
+});
+return rows;
+"""
+
+# returns [{linkedin_url, institution_name, degree, times, description}]
+EXTRACT_EDUCATIONS = EXTRACT_PRELUDE + """
+var rows = [];
+sectionItems().forEach(function (item) {
+    var elements = kids(entity(item));
+    if (elements.length < 2) { return; }
+    var details = kids(elements[1]);
+    if (!details.length) { return; }
+    var outer = kids(details[0].firstElementChild);
+    rows.push({
+        linkedin_url: href(elements[0].firstElementChild),
+        institution_name: spanText(outer[0]),
+        degree: outer.length > 1 ? spanText(outer[1]) : null,
+        times: outer.length > 2 ? spanText(outer[2]) : null,
+        description: text(details[1])
+    });
+});
+return rows;
+"""
+
+# returns [{linkedin_url, credential_url, cert_name, institution_name,
+#           date_text, credential_id, skills}]
+EXTRACT_CERTIFICATIONS = EXTRACT_PRELUDE + """
+var rows = [];
+sectionItems().forEach(function (item) {
+    var elements = kids(entity(item));
+    if (elements.length !== 2) { return; }
+    var detailsList = kids(elements[1]);
+    var firstLink = elements[1].querySelector('a');
+    if (!detailsList.length || !firstLink) { return; }
+    var details = kids(detailsList[0].firstElementChild);
+    if (!details.length) { return; }
+    var skill = detailsList[1] ? detailsList[1].querySelector('li.pvs-list__item--with-top-padding') : null;
+    rows.push({
+        linkedin_url: href(elements[0].firstElementChild),
+        credential_url: href(firstLink),
+        cert_name: spanText(details[0]),
+        institution_name: details.length > 1 ? spanText(details[1]) : null,
+        date_text: details.length > 2 ? spanText(details[2]) : null,
+        credential_id: details.length > 3 ? spanText(details[3]) : null,
+        skills: skill ? text(skill.querySelector("span[aria-hidden='true']")).replace('Skills: ', '') : null
+    });
+});
+return rows;
+"""
+
+# arguments: root element (or null for the document), css selector of the cards.
+# returns [{job_title, linkedin_url, company, location}]
+EXTRACT_JOB_CARDS = EXTRACT_PRELUDE + """
+var root = arguments[0] || document;
+return Array.prototype.slice.call(root.querySelectorAll(arguments[1])).map(function (card) {
+    var title = card.querySelector('.job-card-list__title');
+    return {
+        job_title: text(title),
+        linkedin_url: href(title),
+        company: text(card.querySelector('.artdeco-entity-lockup__subtitle')),
+        location: text(card.querySelector('.job-card-container__metadata-wrapper'))
+    };
+});
+"""
+
+EMPLOYEE_CARDS = EXTRACT_PRELUDE + """
+function employeeCards(list, start) {
+    return Array.prototype.slice.call(list.querySelectorAll('li'), start).map(function (card) {
+        var lines = (card.innerText || '').split('\\n');
+        var link = card.querySelector('a');
+        if (lines.length < 4 || !link) { return null; }
+        return {name: lines[0].trim(), designation: lines[3].trim(), linkedin_url: href(link)};
+    });
+}
+"""
+
+# arguments: index of the first card to return, settle period in ms, quiet
+# period in ms, timeout in ms.
+# Scrolls the people list once and resolves with the cards from the index on
+# as soon as new ones have settled, or with [] once nothing new arrived for
+# the quiet period.
+HARVEST_EMPLOYEES = EMPLOYEE_CARDS + """
+var start = arguments[0], settle = arguments[1], quiet = arguments[2], timeout = arguments[3];
+var done = arguments[arguments.length - 1];
+var list = document.querySelector('.list-style-none');
+if (!list) { done([]); return; }
+function count() { return list.querySelectorAll('li').length; }
+var began = Date.now(), last = Date.now(), seen = count();
+window.scrollTo(0, document.body.scrollHeight);
+var timer = setInterval(function () {
+    var now = Date.now(), current = count();
+    if (current !== seen) {
+        seen = current;
+        last = now;
+        window.scrollTo(0, document.body.scrollHeight);
+    }
+    var settled = current > start && now - last >= settle;
+    if (settled || now - last >= quiet || now - began >= timeout) {
+        clearInterval(timer);
+        done(employeeCards(list, start));
+    }
+}, 100);
+"""
+
+# arguments: the about grid element.
+# returns {about_us, labels, values}
+EXTRACT_COMPANY_ABOUT = EXTRACT_PRELUDE + """
+var grid = arguments[0];
+var description = grid.querySelector('p');
+return {
+    about_us: description ? text(description) : null,
+    labels: Array.prototype.slice.call(grid.querySelectorAll('dt')).map(text),
+    values: Array.prototype.slice.call(grid.querySelectorAll('dd')).map(text)
+};
+"""
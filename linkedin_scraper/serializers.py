@@ -0,0 +1,129 @@
+import json
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+
+# Serialized fields of each entity, with the value used when it is unset.
+# Keyed by class name so entity modules can import this one.
+ENTITY_FIELDS = {
+    "Person": {
+        "linkedin_url": None,
+        "name": "",
+        "headline": "",
+        "about": [],
+        "experiences": [],
+        "certifications": [],
+        "educations": [],
+        "skills": [],
+        "languages": [],
+        "interests": [],
+        "accomplishments": [],
+        "contacts": [],
+    },
+    "Company": {
+        "linkedin_url": None,
+        "name": None,
+        "about_us": None,
+        "specialties": None,
+        "website": None,
+        "phone": None,
+        "industry": None,
+        "company_type": None,
+        "headquarters": None,
+        "company_size": None,
+        "founded": None,
+        "headcount": None,
+        "showcase_pages": [],
+        "affiliated_companies": [],
+        "employees": [],
+    },
+    "CompanySummary": {
+        "linkedin_url": None,
+        "name": None,
+        "followers": None,
+    },
+    "Job": {
+        "linkedin_url": None,
+        "job_id": None,
+        "job_title": None,
+        "company": None,
+        "company_linkedin_url": None,
+        "location": None,
+        "posted_date": None,
+        "applicant_count": None,
+        "job_description": None,
+        "benefits": None,
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def _field_table(obj_type):
+    for base in obj_type.__mro__:
+        if base.__name__ in ENTITY_FIELDS:
+            return tuple(ENTITY_FIELDS[base.__name__].items())
+    if is_dataclass(obj_type):
+        return tuple((record_field.name, None) for record_field in fields(obj_type))
+    return None
+
+
+def shallow_dict(obj):
+    """The serialized fields of `obj` as a dict; nested entities and records
+    are left as they are. Returns None for types without a field table."""
+    table = _field_table(type(obj))
+    if table is None:
+        return None
+    return {name: getattr(obj, name, default) for name, default in table}
+
+
+def to_dict(obj):
+    """Converts an entity or record and the records it holds into dicts,
+    without copying the field values themselves."""
+    result = shallow_dict(obj)
+    for name, value in result.items():
+        if isinstance(value, list):
+            result[name] = [_nested(item) for item in value]
+        else:
+            result[name] = _nested(value)
+    return result
+
+
+def _nested(value):
+    converted = shallow_dict(value)
+    return value if converted is None else converted
+
+
+def _default(obj):
+    converted = shallow_dict(obj)
+    if converted is None:
+        return str(obj)
+    return converted
+
+
+_encoder = json.JSONEncoder(default=_default, ensure_ascii=False)
+
+
+def dump(obj, fp):
+    """Streams `obj` as JSON into the file-like `fp`, one field or list item
+    at a time, so large entities are never held as a single string."""
+    entity_fields = shallow_dict(obj)
+    if entity_fields is None:
+        fp.write(_encoder.encode(obj))
+        return
+    fp.write("{")
+    for i, (name, value) in enumerate(entity_fields.items()):
+        fp.write(", " if i else "")
+        fp.write(_encoder.encode(name))
+        fp.write(": ")
+        if isinstance(value, list):
+            fp.write("[")
+            for j, item in enumerate(value):
+                fp.write(", " if j else "")
+                fp.write(_encoder.encode(item))
+            fp.write("]")
+        else:
+            fp.write(_encoder.encode(value))
+    fp.write("}")
+
+
+def dumps(obj):
+    return _encoder.encode(obj)
@@ -29,6 +29,7 @@ setup(
     download_url = 'https://github.com/joeyism/linkedin_scraper/dist/' + version + '.tar.gz', 
     keywords = ['linkedin', 'scraping', 'scraper'],
     classifiers = [], 
+    python_requires = '>=3.10',
     install_requires=[package.split("\n")[0] for package in open("requirements.txt", "r").readlines()]
 )
 
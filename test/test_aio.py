@@ -0,0 +1,88 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from linkedin_scraper import Company, backends
+from linkedin_scraper.aio import AsyncSession
+
+
+def public_page(slug):
+    return (
+        '<html><body><h1 class="name">{0}</h1>'
+        '<p class="basic-info-description">About {0}</p>'
+        '<span class="industry">Software</span>'
+        '<div class="affiliated-companies"><div class="affiliated-company-name">'
+        '<a href="https://www.linkedin.com/company/{0}-labs">{0} Labs</a></div></div>'
+        "</body></html>".format(slug)
+    ).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = public_page(self.path.strip("/").split("/")[-1])
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield "http://127.0.0.1:{}".format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_fetch_public_companies(stub_server):
+    async def fetch_all():
+        async with AsyncSession(http=backends.HttpBackend(), max_workers=4) as session:
+            return await asyncio.gather(
+                *(
+                    Company.fetch("{}/company/company-{}".format(stub_server, i), session)
+                    for i in range(8)
+                )
+            )
+
+    companies = asyncio.run(fetch_all())
+    assert [company.name for company in companies] == [
+        "company-{}".format(i) for i in range(8)
+    ]
+    assert companies[0].about_us == "About company-0"
+    assert companies[0].industry == "Software"
+    assert [summary.name for summary in companies[0].affiliated_companies] == [
+        "company-0 Labs"
+    ]
+
+
+def test_run_leases_each_driver_to_one_call_at_a_time():
+    drivers = ["first", "second"]
+    busy = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def work(driver):
+        with lock:
+            if driver in busy:
+                overlaps.append(driver)
+            busy.add(driver)
+        threading.Event().wait(0.01)
+        with lock:
+            busy.discard(driver)
+        return driver
+
+    async def run_all():
+        async with AsyncSession(drivers) as session:
+            return await asyncio.gather(*(session.run(work) for _ in range(6)))
+
+    assert set(asyncio.run(run_all())) <= set(drivers)
+    assert overlaps == []
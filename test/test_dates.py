@@ -0,0 +1,86 @@
+from linkedin_scraper import dates
+from linkedin_scraper.dates import DateRange
+
+
+def test_split_work_times_month_and_year():
+    assert dates.split_work_times("Jan 2020 - Mar 2021 · 1 yr 3 mos") == (
+        "Jan 2020",
+        "Mar 2021",
+        "1 yr 3 mos",
+    )
+
+
+def test_split_work_times_year_only():
+    assert dates.split_work_times("2019 - 2020") == ("2019", "2020", None)
+
+
+def test_split_work_times_single_date():
+    assert dates.split_work_times("Jan 2020") == ("Jan 2020", "", None)
+    assert dates.split_work_times("") == ("", "", None)
+
+
+def test_parse_work_times_month_and_year():
+    assert dates.parse_work_times("Jan 2020 - Mar 2021 · 1 yr 3 mos") == DateRange(
+        2020, 1, 2021, 3, False, 15
+    )
+
+
+def test_parse_work_times_present():
+    assert dates.parse_work_times("Jan 2020 - Present · 4 yrs 2 mos") == DateRange(
+        2020, 1, None, None, True, 50
+    )
+
+
+def test_parse_work_times_year_only_present():
+    assert dates.parse_work_times("2019 - Present · 5 yrs") == DateRange(
+        2019, None, None, None, True, 60
+    )
+
+
+def test_parse_work_times_year_only_range():
+    assert dates.parse_work_times("2019 - 2020") == DateRange(
+        2019, None, 2020, None, False, 24
+    )
+
+
+def test_parse_work_times_same_year_or_month():
+    assert dates.parse_work_times("2020 - 2020").months == 12
+    assert dates.parse_work_times("Jan 2020 - Jan 2020").months == 1
+
+
+def test_parse_work_times_mixed_precision():
+    assert dates.parse_work_times("2019 - Dec 2019").months == 12
+    assert dates.parse_work_times("Jun 2019 - 2019").months == 7
+    assert dates.parse_work_times("2018 - Mar 2019").months == 15
+
+
+def test_parse_work_times_en_dash():
+    assert dates.parse_work_times("Feb 2018 – Feb 2018") == DateRange(
+        2018, 2, 2018, 2, False, 1
+    )
+
+
+def test_parse_date():
+    assert dates.parse_date("Sept 2019") == (2019, 9)
+    assert dates.parse_date("2019") == (2019, None)
+    assert dates.parse_date("Present") is None
+
+
+def test_parse_duration():
+    assert dates.parse_duration("4 yrs 2 mos") == 50
+    assert dates.parse_duration("1 mo") == 1
+    assert dates.parse_duration("less than a year") == 0
+    assert dates.parse_duration("") is None
+
+
+def test_split_education_times():
+    assert dates.split_education_times("2015 - 2019") == ("2015", "2019")
+    assert dates.split_education_times("2015") == (None, None)
+
+
+def test_split_certification_dates():
+    assert dates.split_certification_dates("Issued Jan 2020 · Expires Jan 2023") == (
+        "Jan 2020",
+        "Jan 2023",
+    )
+    assert dates.split_certification_dates(None) == (None, None)
@@ -0,0 +1,119 @@
+from urllib.parse import parse_qs, urlsplit
+
+from linkedin_scraper.crawler import canonical_company_url
+from linkedin_scraper.job_index import CHANGED, NEW, JobIndex
+from linkedin_scraper.job_search import JobSearch
+from linkedin_scraper.jobs import Job, job_id_from_url
+
+
+def make_job(job_id, title="Data Engineer", company="Acme", location="London"):
+    return Job(
+        linkedin_url="https://www.linkedin.com/jobs/view/{}/".format(job_id),
+        job_title=title,
+        company=company,
+        location=location,
+        scrape=False,
+    )
+
+
+def test_job_id_from_url():
+    assert job_id_from_url("https://www.linkedin.com/jobs/view/3456898261/") == "3456898261"
+    assert job_id_from_url(
+        "https://www.linkedin.com/jobs/collections/recommended/?currentJobId=3456898261"
+    ) == "3456898261"
+    assert job_id_from_url("https://www.linkedin.com/jobs/search/?keywords=python") is None
+    assert job_id_from_url(None) is None
+
+
+def test_job_index_check_and_record():
+    with JobIndex(":memory:") as index:
+        job = make_job(1)
+        status, digest = index.check(job)
+        assert status == NEW
+        assert "1" not in index and len(index) == 0
+
+        index.record(job.job_id, digest, now=100)
+        assert index.check(job) == (None, digest)
+
+        edited = make_job(1, title="Senior Data Engineer")
+        assert index.check(edited)[0] == CHANGED
+
+        index.record(edited.job_id, index.check(edited)[1], now=200)
+        entry = index.get("1")
+        assert (entry.first_seen, entry.last_seen) == (100, 200)
+        assert len(index) == 1
+
+
+def test_job_index_observe_without_job_id():
+    with JobIndex(":memory:") as index:
+        job = Job(linkedin_url=None, job_title="Data Engineer", scrape=False)
+        assert index.observe(job) == NEW
+        assert index.observe(job) == NEW
+        assert len(index) == 0
+
+
+def test_job_index_persists(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+    with JobIndex(path) as index:
+        index.observe(make_job(1), now=100)
+    with JobIndex(path) as index:
+        assert index.check(make_job(1))[0] is None
+
+
+def test_search_url():
+    search = JobSearch(driver=None, scrape=False)
+    url = search.search_url(
+        "data engineer", location="London", posted_within="week", remote=True, start=25
+    )
+    parts = urlsplit(url)
+    assert parts.path == "/jobs/search"
+    assert parse_qs(parts.query) == {
+        "keywords": ["data engineer"],
+        "refresh": ["true"],
+        "location": ["London"],
+        "f_TPR": ["r604800"],
+        "f_WT": ["2"],
+        "start": ["25"],
+    }
+    assert "start" not in search.search_url("python")
+    assert "f_TPR=r3600" in search.search_url("python", posted_within=3600)
+
+
+class FakeSearch(JobSearch):
+    def __init__(self, jobs):
+        super().__init__(driver=None, scrape=False)
+        self.jobs = jobs
+
+    def iter_search(self, search_term, max_results=None, **filters):
+        return iter(self.jobs)
+
+
+def test_poll_yields_new_and_changed_postings_only():
+    with JobIndex(":memory:") as index:
+        first = list(FakeSearch([make_job(1), make_job(2)]).poll("python", index))
+        assert [job.job_id for job in first] == ["1", "2"]
+
+        second = FakeSearch([make_job(1), make_job(2, location="Remote"), make_job(3)])
+        assert [job.job_id for job in second.poll("python", index)] == ["2", "3"]
+        assert list(second.poll("python", index)) == []
+
+
+def test_poll_records_a_posting_only_once_it_is_yielded():
+    with JobIndex(":memory:") as index:
+        polled = FakeSearch([make_job(1), make_job(2)]).poll("python", index)
+        next(polled)
+        polled.close()
+        assert "1" in index
+        assert "2" not in index
+
+
+def test_canonical_company_url():
+    assert canonical_company_url(
+        "https://ca.linkedin.com/company/Google/about/?trk=x"
+    ) == "https://www.linkedin.com/company/google/"
+    assert canonical_company_url(
+        "https://www.linkedin.com/showcase/acme-labs"
+    ) == "https://www.linkedin.com/showcase/acme-labs/"
+    assert canonical_company_url("https://www.linkedin.com/in/someone/") is None
+    assert canonical_company_url("https://example.com/company/acme/") is None
+    assert canonical_company_url(None) is None
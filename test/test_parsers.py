@@ -0,0 +1,278 @@
+from linkedin_scraper import parsers
+from linkedin_scraper.company import Company
+from linkedin_scraper.jobs import Job
+from linkedin_scraper.person import Person
+
+EXPERIENCES_PAGE = """<html><body><main><div class="pvs-list__container"><ul>
+<li class="pvs-list__paged-list-item artdeco-list__item">
+ <div data-view-name="profile-component-entity">
+  <div><a href="https://www.linkedin.com/company/123/"><img/></a></div>
+  <div>
+   <div><div>
+     <div><span aria-hidden="true">Software Engineer</span><span class="visually-hidden">Software Engineer</span></div>
+     <span><span aria-hidden="true">Acme · Full-time</span></span>
+     <span><span aria-hidden="true">Jan 2020 - Present · 4 yrs 2 mos</span></span>
+     <span><span aria-hidden="true">London</span></span>
+   </div></div>
+   <div><ul><li>Built things</li></ul></div>
+  </div>
+ </div>
+</li></ul></div></main></body></html>"""
+
+EDUCATIONS_PAGE = """<html><body><main><div class="pvs-list__container"><ul>
+<li class="pvs-list__paged-list-item">
+ <div data-view-name="profile-component-entity">
+  <div><a href="https://www.linkedin.com/school/456/"><img/></a></div>
+  <div>
+   <div><div>
+     <div><span aria-hidden="true">Example University</span></div>
+     <span><span aria-hidden="true">BSc, Physics</span></span>
+     <span><span aria-hidden="true">2014 - 2017</span></span>
+   </div></div>
+   <div>Graduated with honours</div>
+  </div>
+ </div>
+</li></ul></div></main></body></html>"""
+
+CERTIFICATIONS_PAGE = """<html><body><main><div class="pvs-list__container"><ul>
+<li class="pvs-list__paged-list-item">
+ <div data-view-name="profile-component-entity">
+  <div><a href="https://www.linkedin.com/company/789/"><img/></a></div>
+  <div>
+   <div><a href="https://certs.example.com/1">
+     <div><span aria-hidden="true">Cloud Architect</span></div>
+     <span><span aria-hidden="true">Example Cloud</span></span>
+     <span><span aria-hidden="true">Issued Jan 2021 · Expires Jan 2024</span></span>
+     <span><span aria-hidden="true">Credential ID ABC-1</span></span>
+   </a></div>
+  </div>
+ </div>
+</li></ul></div></main></body></html>"""
+
+SKILLS_PAGE = """<html><body><main><div class="pvs-list__container"><ul>
+<li class="pvs-list__paged-list-item">
+ <div data-view-name="profile-component-entity">
+  <div></div><div><span aria-hidden="true">Python</span></div>
+ </div>
+</li>
+<li class="pvs-list__paged-list-item">
+ <div data-view-name="profile-component-entity">
+  <div></div><div><span aria-hidden="true">SQL</span></div>
+ </div>
+</li></ul></div></main></body></html>"""
+
+EMPTY_SECTION_PAGE = """<html><body><main><div class="pvs-list__container"><ul>
+<li class="pvs-list__paged-list-item"><section class="artdeco-empty-state">
+ <h2 class="artdeco-empty-state__headline">Nothing to see for now</h2>
+</section></li></ul></div></main></body></html>"""
+
+
+def company_card(url, name, followers):
+    return """<li class="org-company-card">
+ <a class="company-name-link" href="{}">{}</a>
+ <span class="company-followers-count">{}</span>
+</li>""".format(url, name, followers)
+
+
+COMPANY_ABOUT_PAGE = """<html><body>
+<h1 class="org-top-card-summary__title"> Acme </h1>
+<section class="artdeco-card org-page-details-module__card-spacing org-about-module__margin-bottom">
+ <p>We make things</p>
+ <dl>
+  <dt>Website</dt><dd>acme.com</dd>
+  <dt>Company size</dt><dd>11-50 employees</dd><dd>30 associated members</dd>
+  <dt>Founded</dt><dd>1999</dd>
+  <dt>Specialties</dt><dd>anvils, rockets</dd>
+ </dl>
+</section>
+<div class="mt1"><span>See all 1,234 employees on LinkedIn</span></div>
+<ul class="company-list">{}</ul>
+<ul class="company-list">{}{}</ul>
+</body></html>""".format(
+    company_card("https://www.linkedin.com/showcase/acme-labs/", "Acme Labs", "500 followers"),
+    company_card("https://www.linkedin.com/company/acme-uk/", "Acme UK", "2,000 followers"),
+    company_card("https://www.linkedin.com/company/acme-de/", "Acme DE", "1,000 followers"),
+)
+
+PUBLIC_COMPANY_PAGE = """<html><body>
+<h1 class="name">Acme</h1>
+<p class="basic-info-description">We make things</p>
+<div class="industry">Manufacturing</div>
+<div class="website"><h3>Website</h3><a href="https://acme.com">acme.com</a></div>
+<div class="founded"><h3>Founded</h3><p>1999</p></div>
+<ul class="company-showcase-pages">
+ <li><h3 class="name"><a href="https://www.linkedin.com/showcase/acme-labs">Acme Labs</a></h3><p>500 followers</p></li>
+</ul>
+<ul class="affiliated-companies">
+ <li><h3 class="affiliated-company-name"><a href="https://www.linkedin.com/company/acme-uk">Acme UK</a></h3></li>
+</ul>
+</body></html>"""
+
+PEOPLE_PAGE = """<html><body><ul class="list-style-none">
+<li><a href="https://www.linkedin.com/in/ann"><div>Ann Example</div></a>
+ <div>1st</div><div>London</div><div>CEO at Acme</div></li>
+<li><div>Load more</div></li>
+</ul></body></html>"""
+
+JOB_PAGE = """<html><body>
+<h1 class="job-details-jobs-unified-top-card__job-title">Data Engineer</h1>
+<div class="job-details-jobs-unified-top-card__company-name">
+ <a href="https://www.linkedin.com/company/acme/">Acme</a>
+</div>
+<div class="job-details-jobs-unified-top-card__primary-description-container">
+ <span>London</span><span> </span><span>·</span><span>Reposted</span><span>2 days ago</span>
+</div>
+<div class="jobs-description">Build pipelines.</div>
+</body></html>"""
+
+
+def test_text_of_skips_visually_hidden_duplicates():
+    root = parsers.document(
+        '<div><span aria-hidden="true">Name</span><span class="visually-hidden">Name</span></div>'
+    )
+    assert parsers.text_of(root) == "Name"
+    assert parsers.text_of(None) == ""
+
+
+def test_parse_experiences():
+    [experience] = parsers.parse_experiences(EXPERIENCES_PAGE)
+    assert experience.position_title == "Software Engineer"
+    assert experience.institution_name == "Acme · Full-time"
+    assert experience.from_date == "Jan 2020"
+    assert experience.to_date == "Present"
+    assert experience.duration == "4 yrs 2 mos"
+    assert experience.location == "London"
+    assert experience.description == "Built things"
+    assert experience.linkedin_url == "https://www.linkedin.com/company/123/"
+
+
+def test_parse_educations():
+    [education] = parsers.parse_educations(EDUCATIONS_PAGE)
+    assert education.institution_name == "Example University"
+    assert education.degree == "BSc, Physics"
+    assert (education.from_date, education.to_date) == ("2014", "2017")
+    assert education.description == "Graduated with honours"
+    assert education.linkedin_url == "https://www.linkedin.com/school/456/"
+
+
+def test_parse_certifications():
+    [certification] = parsers.parse_certifications(CERTIFICATIONS_PAGE)
+    assert certification.cert_name == "Cloud Architect"
+    assert certification.institution_name == "Example Cloud"
+    assert certification.issued_date == "Jan 2021"
+    assert certification.expired_date == "Jan 2024"
+    assert certification.credential_id == "Credential ID ABC-1"
+    assert certification.credential_url == "https://certs.example.com/1"
+
+
+def test_parse_skills():
+    assert [skill.name for skill in parsers.parse_skills(SKILLS_PAGE)] == ["Python", "SQL"]
+    assert parsers.parse_skills(EMPTY_SECTION_PAGE) == []
+
+
+def test_section_parsers_without_a_list():
+    assert parsers.parse_experiences("<html><body><main></main></body></html>") == []
+
+
+def test_company_about_fields_skips_associated_members():
+    assert parsers.company_about_fields(
+        ["Company size", "Founded"], ["11-50 employees", "30 associated members", "1999"]
+    ) == {"company_size": "11-50 employees", "founded": "1999"}
+
+
+def test_parse_company_page():
+    fields = parsers.parse_company_page(COMPANY_ABOUT_PAGE)
+    assert fields["name"] == "Acme"
+    assert fields["about_us"] == "We make things"
+    assert fields["website"] == "acme.com"
+    assert fields["company_size"] == "11-50 employees"
+    assert fields["founded"] == "1999"
+    assert fields["specialties"] == "anvils\nrockets"
+    assert fields["headcount"] == 1234
+    assert fields["showcase_pages"] == [
+        {
+            "linkedin_url": "https://www.linkedin.com/showcase/acme-labs/",
+            "name": "Acme Labs",
+            "followers": "500 followers",
+        }
+    ]
+    assert [card["name"] for card in fields["affiliated_companies"]] == ["Acme UK", "Acme DE"]
+
+
+def test_parse_related_companies_needs_both_lists():
+    page = '<html><body><ul class="company-list">{}</ul></body></html>'.format(
+        company_card("https://www.linkedin.com/showcase/x/", "X", "1 follower")
+    )
+    assert parsers.parse_related_companies(page) == {}
+
+
+def test_parse_public_company_page():
+    fields = parsers.parse_public_company_page(PUBLIC_COMPANY_PAGE)
+    assert fields["name"] == "Acme"
+    assert fields["about_us"] == "We make things"
+    assert fields["industry"] == "Manufacturing"
+    assert fields["website"] == "acme.com"
+    assert fields["founded"] == "1999"
+    assert fields["showcase_pages"] == [
+        {
+            "linkedin_url": "https://www.linkedin.com/showcase/acme-labs",
+            "name": "Acme Labs",
+            "followers": "500 followers",
+        }
+    ]
+    assert fields["affiliated_companies"] == [
+        {"linkedin_url": "https://www.linkedin.com/company/acme-uk", "name": "Acme UK"}
+    ]
+
+
+def test_parse_employees_skips_unparseable_cards():
+    assert parsers.parse_employees(PEOPLE_PAGE) == [
+        {
+            "name": "Ann Example",
+            "designation": "CEO at Acme",
+            "linkedin_url": "https://www.linkedin.com/in/ann",
+        }
+    ]
+    assert parsers.parse_employees("<html><body></body></html>") == []
+
+
+def test_parse_job():
+    fields = parsers.parse_job(JOB_PAGE)
+    assert fields["job_title"] == "Data Engineer"
+    assert fields["company"] == "Acme"
+    assert fields["company_linkedin_url"] == "https://www.linkedin.com/company/acme/"
+    assert fields["location"] == "London"
+    assert fields["posted_date"] == "2 days ago"
+    assert fields["applicant_count"] == 0
+    assert fields["job_description"] == "Build pipelines."
+    assert fields["benefits"] is None
+
+
+def test_company_from_html():
+    company = Company.from_html(
+        {"about": COMPANY_ABOUT_PAGE, "people": PEOPLE_PAGE},
+        linkedin_url="https://www.linkedin.com/company/acme/",
+    )
+    assert company.name == "Acme"
+    assert len(company.affiliated_companies) == 2
+    assert None not in company.employees
+    assert [employee["name"] for employee in company.employees] == ["Ann Example"]
+
+
+def test_person_from_html():
+    person = Person.from_html(
+        {"experience": EXPERIENCES_PAGE, "education": EDUCATIONS_PAGE},
+        linkedin_url="https://www.linkedin.com/in/ann/",
+    )
+    assert [experience.position_title for experience in person.experiences] == [
+        "Software Engineer"
+    ]
+    assert [education.institution_name for education in person.educations] == [
+        "Example University"
+    ]
+
+
+def test_job_from_html():
+    job = Job.from_html(JOB_PAGE, linkedin_url="https://www.linkedin.com/jobs/view/42/")
+    assert job.job_title == "Data Engineer"
+    assert job.job_id == "42"
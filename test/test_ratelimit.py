@@ -0,0 +1,86 @@
+import pytest
+
+from linkedin_scraper import ratelimit
+from linkedin_scraper.ratelimit import Budget, RateLimiter
+
+PROFILE = "https://www.linkedin.com/in/someone/"
+AUTHWALL = "https://www.linkedin.com/authwall?trk=x"
+
+
+@pytest.fixture(autouse=True)
+def no_installed_limiter():
+    yield
+    ratelimit.install(None)
+
+
+def test_page_type():
+    assert ratelimit.page_type(PROFILE) == "profile"
+    assert ratelimit.page_type("https://www.linkedin.com/showcase/x/") == "company"
+    assert ratelimit.page_type("https://www.linkedin.com/jobs/search/?keywords=x") == "job_search"
+    assert ratelimit.page_type("https://www.linkedin.com/jobs/view/1/") == "job"
+    assert ratelimit.page_type("https://www.linkedin.com/feed/") == "other"
+
+
+def test_take_spends_the_burst_then_refills():
+    limiter = RateLimiter(budgets={"profile": Budget(rate=0.5, burst=2)})
+    assert limiter._take("profile", 100) == 0
+    assert limiter._take("profile", 100) == 0
+    assert limiter._take("profile", 100) == pytest.approx(2)
+    assert limiter._take("profile", 101) == pytest.approx(1)
+    assert limiter._take("profile", 102) == 0
+
+
+def test_take_keeps_page_types_apart():
+    limiter = RateLimiter(budgets={}, default=Budget(rate=1, burst=1))
+    assert limiter._take("profile", 100) == 0
+    assert limiter._take("company", 100) == 0
+    assert limiter._take("profile", 100) > 0
+
+
+def test_report_backs_off_doubling_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(ratelimit.time, "time", lambda: 1000)
+    limiter = RateLimiter(backoff=10, max_backoff=25)
+    pauses = []
+    for _ in range(3):
+        limiter.report(PROFILE, AUTHWALL)
+        pauses.append(limiter._take("profile", 1000))
+    assert pauses == [10, 20, 25]
+    assert limiter._take("profile", 1025) == 0
+
+
+def test_report_recovers_after_a_normal_page():
+    limiter = RateLimiter(backoff=10)
+    limiter.report(PROFILE, AUTHWALL)
+    assert limiter._memory["strikes"] == 1
+    limiter.report(PROFILE, PROFILE)
+    assert limiter._memory["strikes"] == 0
+    # asking for the login page and getting it is not a block
+    limiter.report("https://www.linkedin.com/login", "https://www.linkedin.com/login")
+    assert limiter._memory["strikes"] == 0
+
+
+def test_limiters_share_state_through_a_file(tmp_path):
+    path = str(tmp_path / "limits.json")
+    budgets = {"profile": Budget(rate=0.1, burst=1)}
+    first = RateLimiter(budgets=budgets, path=path)
+    second = RateLimiter(budgets=budgets, path=path)
+    assert first._take("profile", 100) == 0
+    assert second._take("profile", 100) == pytest.approx(10)
+
+    second.report(PROFILE, AUTHWALL)
+    assert first._take("company", 100) > 0
+
+
+def test_navigate_reports_unless_probing():
+    class Driver:
+        current_url = None
+
+        def get(self, url):
+            self.current_url = AUTHWALL
+
+    limiter = RateLimiter(backoff=10)
+    ratelimit.install(limiter)
+    ratelimit.navigate(Driver(), "https://www.linkedin.com/feed/", probe=True)
+    assert limiter._memory.get("strikes", 0) == 0
+    ratelimit.navigate(Driver(), PROFILE)
+    assert limiter._memory["strikes"] == 1
@@ -0,0 +1,93 @@
+import io
+import json
+
+from linkedin_scraper import serializers
+from linkedin_scraper.company import Company, CompanySummary
+from linkedin_scraper.jobs import Job
+from linkedin_scraper.objects import Experience, Skill
+from linkedin_scraper.person import Person
+
+
+def make_person():
+    person = Person(linkedin_url="https://www.linkedin.com/in/ann/", get=False, scrape=False)
+    person.name = "Ann Example"
+    person.add_experience(
+        Experience(
+            institution_name="Acme",
+            position_title="Engineer",
+            from_date="Jan 2020",
+            to_date="Present",
+        )
+    )
+    person.add_skill(Skill(name="Python"))
+    return person
+
+
+def make_company():
+    company = Company(
+        linkedin_url="https://www.linkedin.com/company/acme/",
+        name="Acme",
+        get=False,
+        scrape=False,
+    )
+    company.showcase_pages = [
+        CompanySummary(
+            linkedin_url="https://www.linkedin.com/showcase/acme-labs/",
+            name="Acme Labs",
+            followers="500 followers",
+        )
+    ]
+    company.employees = [
+        {"name": "Ann Example", "designation": "CEO", "linkedin_url": "https://www.linkedin.com/in/ann/"}
+    ]
+    return company
+
+
+def test_to_dict_converts_nested_records():
+    result = serializers.to_dict(make_person())
+    assert result["name"] == "Ann Example"
+    assert result["experiences"][0]["institution_name"] == "Acme"
+    assert result["experiences"][0]["to_date"] == "Present"
+    assert result["skills"] == [{"name": "Python"}]
+    assert list(result) == list(serializers.ENTITY_FIELDS["Person"])
+
+
+def test_to_dict_converts_nested_entities():
+    result = make_company().to_dict()
+    assert result["showcase_pages"] == [
+        {
+            "linkedin_url": "https://www.linkedin.com/showcase/acme-labs/",
+            "name": "Acme Labs",
+            "followers": "500 followers",
+        }
+    ]
+    assert result["affiliated_companies"] == []
+    assert result["employees"][0]["designation"] == "CEO"
+
+
+def test_shallow_dict_leaves_nested_values():
+    company = make_company()
+    result = serializers.shallow_dict(company)
+    assert result["showcase_pages"][0] is company.showcase_pages[0]
+    assert serializers.shallow_dict("not an entity") is None
+
+
+def test_job_includes_job_id():
+    job = Job(linkedin_url="https://www.linkedin.com/jobs/view/42/", job_title="Data Engineer", scrape=False)
+    result = job.to_dict()
+    assert result["job_id"] == "42"
+    assert result["job_title"] == "Data Engineer"
+
+
+def test_dump_matches_dumps_and_to_dict():
+    for obj in (make_person(), make_company(), Job(linkedin_url="https://www.linkedin.com/jobs/view/42/", scrape=False)):
+        fp = io.StringIO()
+        serializers.dump(obj, fp)
+        assert json.loads(fp.getvalue()) == json.loads(serializers.dumps(obj))
+        assert json.loads(fp.getvalue()) == serializers.to_dict(obj)
+
+
+def test_dump_plain_values():
+    fp = io.StringIO()
+    serializers.dump([1, "é"], fp)
+    assert fp.getvalue() == '[1, "é"]'